@@ -5,19 +5,41 @@ import (
 	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"log/slog"
 	"net/http"
 	"os"
+	"regexp"
 	"strings"
+	"sync"
 	"time"
+	"unicode/utf8"
 
 	"github.com/blockops-sh/ponos/config"
 	"github.com/slack-go/slack"
 	"github.com/slack-go/slack/slackevents"
 )
 
+const (
+	defaultLogSnippetLines     = 40
+	defaultDiagnosticsDebounce = 60 * time.Second
+	maxListedToolSummaries     = 5
+
+	// Slack rejects section text over 3000 characters and section fields
+	// over 2000. Field values leave room for the title and code fences
+	// mdField and the callers add.
+	maxSlackSectionText = 3000
+	maxSlackFieldText   = 2000
+	maxSlackFieldValue  = maxSlackFieldText - 100
+
+	// maxAgentResponseBytes caps JSON replies decoded from agent-core.
+	maxAgentResponseBytes = 8 << 20
+
+	slackPostInterval  = 1 * time.Second
+	maxSlackRetryAfter = 30 * time.Second
+)
 
 type Bot struct {
 	client        *slack.Client
@@ -27,6 +49,28 @@ type Bot struct {
 	agentCoreURL  string
 	httpClient    *http.Client
 	githubHandler *GitHubDeployHandler
+
+	logFilterMu  sync.Mutex
+	logFilterSrc string
+	logFilterRe  *regexp.Regexp
+
+	diagMu   sync.Mutex
+	diagRuns map[string]*diagnosticsRun
+
+	ponosPayloadMu  sync.Mutex
+	ponosPayloadCfg *config.Config
+	ponosPayload    map[string]any
+
+	slackPostMu   sync.Mutex
+	slackNextPost map[string]time.Time
+}
+
+// diagnosticsRun tracks the latest /diagnose run for a service so repeated
+// requests inside the debounce window don't trigger another run.
+type diagnosticsRun struct {
+	inFlight bool
+	finished time.Time
+	result   DiagnosticsResult
 }
 
 func NewBot(cfg *config.Config, logger *slog.Logger, slackClient *slack.Client, enableMCP bool) *Bot {
@@ -158,7 +202,7 @@ func (b *Bot) handleMessage(event *slackevents.MessageEvent) {
 
 	if event.ChannelType == "im" {
 		text := fmt.Sprintf("Hi <@%s>! I received your direct message: %s", event.User, event.Text)
-		if _, _, err := b.client.PostMessage(event.Channel, slack.MsgOptionText(text, false)); err != nil {
+		if _, _, err := b.postMessage(event.Channel, slack.MsgOptionText(text, false)); err != nil {
 			b.logger.Error("error sending direct message response",
 				"error", err,
 				"user", event.User,
@@ -304,6 +348,21 @@ func (b *Bot) handleMCPToolCall(w http.ResponseWriter, mcpRequest MCPRequest) {
 		arguments = make(map[string]interface{})
 	}
 
+	if tools, err := b.mcpClient.ToolNames(context.Background()); err == nil {
+		if _, ok := tools[toolName]; !ok {
+			w.WriteHeader(http.StatusOK)
+			json.NewEncoder(w).Encode(MCPResponse{
+				JSONRPC: "2.0",
+				ID:      mcpRequest.ID,
+				Error: &MCPError{
+					Code:    -32601,
+					Message: fmt.Sprintf("Tool not found: %s", toolName),
+				},
+			})
+			return
+		}
+	}
+
 	result, err := b.mcpClient.CallTool(context.Background(), toolName, arguments)
 	if err != nil {
 		b.logger.Error("MCP tool call failed", "tool", toolName, "error", err)
@@ -330,7 +389,7 @@ func (b *Bot) handleMCPToolCall(w http.ResponseWriter, mcpRequest MCPRequest) {
 func (b *Bot) sendReleaseSummaryFromAgent(channel string, payload ReleasesWebhookPayload, summary *AgentSummary, prURL ...string) {
 	blocks := buildReleaseNotificationBlocks(payload, summary, prURL...)
 
-	if _, _, err := b.client.PostMessage(channel, slack.MsgOptionBlocks(blocks...)); err != nil {
+	if _, _, err := b.postMessage(channel, slack.MsgOptionBlocks(blocks...)); err != nil {
 		b.logger.Error("failed to send release summary to Slack",
 			"error", err,
 			"channel", channel,
@@ -355,13 +414,46 @@ func (b *Bot) handleDiagnosticsCommand(text, userID, channelID string) *SlashCom
 		}
 	}
 
+	// Without a channel the result has nowhere to go, so don't pay for the
+	// config sync and diagnostics run at all.
+	if channelID == "" {
+		b.logger.Warn("Diagnostics requested without a channel", "service", service, "user", userID)
+		return &SlashCommandResponse{
+			ResponseType: "ephemeral",
+			Text:         "Diagnostics results need a channel to be posted to.",
+		}
+	}
+
+	recent, busy := b.claimDiagnostics(service)
+	if busy {
+		return &SlashCommandResponse{
+			ResponseType: "ephemeral",
+			Text:         fmt.Sprintf("Diagnostics for *%s* are already running.", service),
+		}
+	}
+
+	if recent != nil {
+		go func() {
+			blocks := b.slackDiagnosticMessageBlock(service, *recent)
+			if _, _, err := b.postMessage(channelID, slack.MsgOptionBlocks(blocks...)); err != nil {
+				b.logger.Error("Failed to repost diagnostics result", "service", service, "error", err)
+			}
+		}()
+		return &SlashCommandResponse{
+			ResponseType: "in_channel",
+			Text:         fmt.Sprintf(":mag: Diagnostics for *%s* ran recently, reposting the latest result...", service),
+		}
+	}
+
 	response := &SlashCommandResponse{
 		ResponseType: "in_channel",
 		Text:         fmt.Sprintf(":mag: Running diagnostics for *%s*...", service),
 	}
 
 	go func() {
-		if err := b.triggerDiagnostics(service, channelID); err != nil {
+		result, err := b.triggerDiagnostics(service, channelID)
+		b.releaseDiagnostics(service, result)
+		if err != nil {
 			b.logger.Error("Diagnostics failed", "service", service, "error", err)
 			b.postThreadedSlackMessage(channelID, "", fmt.Sprintf(":x: Diagnostics failed for *%s*: %v", service, err))
 		}
@@ -370,80 +462,115 @@ func (b *Bot) handleDiagnosticsCommand(text, userID, channelID string) *SlashCom
 	return response
 }
 
-func (b *Bot) triggerDiagnostics(service, channelID string) error {
-	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
-	defer cancel()
+// diagnosticsDebounce is the window in which a finished result is reused.
+// Unset means the default; 0 or less disables reuse, though a run already in
+// flight is still not started twice.
+func (b *Bot) diagnosticsDebounce() time.Duration {
+	s := b.config.Diagnostics.Monitoring.DebounceSeconds
+	if s == nil {
+		return defaultDiagnosticsDebounce
+	}
+	if *s <= 0 {
+		return 0
+	}
+	return time.Duration(*s) * time.Second
+}
 
-	if b.config.APIKey != "" {
-		if err := b.trySyncConfig(ctx); err != nil {
-			return fmt.Errorf("failed to sync config to agent-core before diagnostics: %w", err)
+// claimDiagnostics reserves a run for service. It returns the previous result
+// when one finished inside the debounce window, or busy when a run is in flight.
+func (b *Bot) claimDiagnostics(service string) (*DiagnosticsResult, bool) {
+	now := time.Now()
+	window := b.diagnosticsDebounce()
+
+	b.diagMu.Lock()
+	defer b.diagMu.Unlock()
+
+	if b.diagRuns == nil {
+		b.diagRuns = make(map[string]*diagnosticsRun)
+	}
+	for name, run := range b.diagRuns {
+		if !run.inFlight && now.Sub(run.finished) >= window {
+			delete(b.diagRuns, name)
 		}
 	}
 
-	payload := map[string]string{
-		"service": service,
+	if run, ok := b.diagRuns[service]; ok {
+		if run.inFlight {
+			return nil, true
+		}
+		result := run.result
+		return &result, false
 	}
 
-	body, err := json.Marshal(payload)
-	if err != nil {
-		return fmt.Errorf("failed to marshal diagnostics payload: %w", err)
-	}
+	b.diagRuns[service] = &diagnosticsRun{inFlight: true}
+	return nil, false
+}
 
-	url := fmt.Sprintf("%s/diagnostics/run", b.config.APIEndpoint)
-	req, err := http.NewRequestWithContext(ctx, http.MethodPost, url, bytes.NewReader(body))
-	if err != nil {
-		return fmt.Errorf("failed to create diagnostics request: %w", err)
+// releaseDiagnostics ends the in-flight run for service. Only successful
+// results are kept, so a failed run can be retried straight away.
+func (b *Bot) releaseDiagnostics(service string, result *DiagnosticsResult) {
+	b.diagMu.Lock()
+	defer b.diagMu.Unlock()
+
+	if result == nil {
+		delete(b.diagRuns, service)
+		return
 	}
-	req.Header.Set("Content-Type", "application/json")
-	req.Header.Set("Accept", "application/json")
+	b.diagRuns[service] = &diagnosticsRun{finished: time.Now(), result: *result}
+}
 
-	resp, err := b.httpClient.Do(req)
-	if err != nil {
-		return fmt.Errorf("diagnostics request failed: %w", err)
+func (b *Bot) triggerDiagnostics(service, channelID string) (*DiagnosticsResult, error) {
+	ctx, cancel := context.WithTimeout(context.Background(), 60*time.Second)
+	defer cancel()
+
+	if b.config.APIKey != "" {
+		if err := b.trySyncConfig(ctx); err != nil {
+			return nil, fmt.Errorf("failed to sync config to agent-core before diagnostics: %w", err)
+		}
 	}
-	defer resp.Body.Close()
 
-	if resp.StatusCode != http.StatusOK {
-		respBody, _ := io.ReadAll(io.LimitReader(resp.Body, 4096))
-		return fmt.Errorf("nodeoperator api returned status %d: %s", resp.StatusCode, strings.TrimSpace(string(respBody)))
+	payload := map[string]string{
+		"service": service,
 	}
 
 	var diagResp DiagnosticsResponse
-
-	if err := json.NewDecoder(resp.Body).Decode(&diagResp); err != nil {
-		return fmt.Errorf("failed to decode diagnostics response: %w", err)
+	url := fmt.Sprintf("%s/diagnostics/run", b.config.APIEndpoint)
+	if err := b.doJSON(ctx, http.MethodPost, url, payload, &diagResp); err != nil {
+		return nil, fmt.Errorf("diagnostics request failed: %w", err)
 	}
 
 	if !diagResp.Success {
-		return fmt.Errorf("diagnostics service reported failure: %s", diagResp.Error)
+		return nil, fmt.Errorf("diagnostics service reported failure: %s", diagResp.Error)
 	}
 
 	blocks := b.slackDiagnosticMessageBlock(service, diagResp.Result)
 
-	if _, _, err := b.client.PostMessage(
+	if _, _, err := b.postMessage(
 		channelID,
 		slack.MsgOptionBlocks(blocks...),
 	); err != nil {
-		return fmt.Errorf("failed to post diagnostics result to Slack: %w", err)
+		return &diagResp.Result, fmt.Errorf("failed to post diagnostics result to Slack: %w", err)
 	}
 
-	return nil
+	return &diagResp.Result, nil
 }
 
 func (b *Bot) slackDiagnosticMessageBlock(service string, result DiagnosticsResult) []slack.Block {
-	var fields []*slack.TextBlockObject
-
-	if result.Namespace != "" {
-		fields = append(fields, mdField("Namespace", "`"+result.Namespace+"`"))
-	}
-	if result.ResourceType != "" {
-		fields = append(fields, mdField("Resource", "`"+result.ResourceType+"`"))
-	}
-	if result.IssueURL != "" {
-		fields = append(fields, mdField("GitHub issue", "<"+result.IssueURL+">"))
-	}
-	if result.EventsSummary != "" {
-		fields = append(fields, mdField("Events", result.EventsSummary))
+	// Optional fields in display order; empty values are left out.
+	optional := [...]struct {
+		title, value, open, close string
+	}{
+		{"Namespace", result.Namespace, "`", "`"},
+		{"Resource", result.ResourceType, "`", "`"},
+		{"GitHub issue", result.IssueURL, "<", ">"},
+		{"Events", truncateText(result.EventsSummary, maxSlackFieldValue, "…"), "", ""},
+	}
+
+	fields := make([]*slack.TextBlockObject, 0, len(optional))
+	for _, f := range optional {
+		if f.value != "" {
+			fields = append(fields, mdField(f.title, f.open+f.value+f.close))
+		}
 	}
 
 	blocks := []slack.Block{
@@ -457,11 +584,23 @@ func (b *Bot) slackDiagnosticMessageBlock(service string, result DiagnosticsResu
 	}
 
 	if result.Summary != "" {
-		blocks = append(blocks, slack.NewSectionBlock(mdField("Summary", result.Summary), nil, nil))
+		summary := truncateText(result.Summary, maxSlackFieldValue, "…")
+		blocks = append(blocks, slack.NewSectionBlock(mdField("Summary", summary), nil, nil))
 	}
 
 	if result.LogSnippet != "" {
-		blocks = append(blocks, slack.NewSectionBlock(mdField("Log snapshot", "```\n"+result.LogSnippet+"\n```"), nil, nil))
+		snippet := result.LogSnippet
+		re := b.logFilter()
+		if re != nil {
+			snippet = filterLines(snippet, re)
+		}
+		if snippet == "" {
+			note := fmt.Sprintf("_No log lines matched `%s`._", re.String())
+			blocks = append(blocks, slack.NewSectionBlock(mdField("Log snapshot", note), nil, nil))
+		} else {
+			snippet = tailText(tailLines(snippet, b.logSnippetLines()), maxSlackFieldValue, "…\n")
+			blocks = append(blocks, slack.NewSectionBlock(mdField("Log snapshot", "```\n"+snippet+"\n```"), nil, nil))
+		}
 	}
 
 	if result.ResourceDescription != "" {
@@ -470,7 +609,8 @@ func (b *Bot) slackDiagnosticMessageBlock(service string, result DiagnosticsResu
 	}
 
 	if result.Prompt != "" {
-		blocks = append(blocks, slack.NewSectionBlock(mdField("Prompt", "```\n"+result.Prompt+"\n```"), nil, nil))
+		prompt := truncateText(result.Prompt, maxSlackFieldValue, "…")
+		blocks = append(blocks, slack.NewSectionBlock(mdField("Prompt", "```\n"+prompt+"\n```"), nil, nil))
 	}
 
 	return blocks
@@ -482,9 +622,9 @@ func (b *Bot) streamAgentResponseToSlack(event *slackevents.AppMentionEvent, use
 	userID := event.User
 
 	ack := fmt.Sprintf(":wave: <@%s> working on \"%s\" …", userID, userMessage)
-	b.postThreadedSlackMessage(channel, threadTS, ack)
 
 	if b.agentCoreURL == "" {
+		b.postThreadedSlackMessage(channel, threadTS, ack)
 		b.postThreadedSlackMessage(channel, threadTS, ":x: Nodeoperator API is not available. Please check its status and URL.")
 		return
 	}
@@ -495,31 +635,48 @@ func (b *Bot) streamAgentResponseToSlack(event *slackevents.AppMentionEvent, use
 	updates := make(chan StreamingUpdate, 10)
 	errCh := make(chan error, 1)
 
+	// Open the agent stream before acknowledging in Slack so the agent
+	// round-trip overlaps the Slack post instead of queuing behind it.
 	go func() {
 		defer close(updates)
 		errCh <- b.StreamConversation(ctx, userMessage, nil, updates)
 	}()
 
-	var finalResponse string
+	b.postThreadedSlackMessage(channel, threadTS, ack)
+
+	// The agent streams its answer as one "assistant" event followed by
+	// "stream_append" chunks; collect them as they arrive.
+	var response strings.Builder
 	var toolSummaries []string
+	var toolSummaryCount int
 	var toolExecutionCount = make(map[string]int)
 
+	// Agents often emit the same status several times in a row (todo updates
+	// with an unchanged item count, mostly); only post when it changes.
+	var lastStatus string
+	postStatus := func(status string) {
+		if status == lastStatus {
+			return
+		}
+		lastStatus = status
+		b.postThreadedSlackMessage(channel, threadTS, status)
+	}
+
 	for update := range updates {
 		switch update.Type {
 		case "assistant":
-			if update.Message != "" {
-				finalResponse = update.Message
-			}
+			response.Reset()
+			response.WriteString(update.Message)
+		case "stream_append":
+			response.WriteString(update.Message)
 		case "tool_start":
 			if update.Tool != "" {
 				toolExecutionCount[update.Tool]++
 
 				if toolExecutionCount[update.Tool] == 1 {
-					status := fmt.Sprintf(":gear: Running *%s*…", formatToolName(update.Tool))
-					b.postThreadedSlackMessage(channel, threadTS, status)
+					postStatus(fmt.Sprintf(":gear: Running *%s*…", formatToolName(update.Tool)))
 				} else if toolExecutionCount[update.Tool]%3 == 0 {
-					status := fmt.Sprintf(":gear: Still working with *%s* (%d attempts)…", formatToolName(update.Tool), toolExecutionCount[update.Tool])
-					b.postThreadedSlackMessage(channel, threadTS, status)
+					postStatus(fmt.Sprintf(":gear: Still working with *%s* (%d attempts)…", formatToolName(update.Tool), toolExecutionCount[update.Tool]))
 				}
 			}
 		case "tool_result":
@@ -533,13 +690,19 @@ func (b *Bot) streamAgentResponseToSlack(event *slackevents.AppMentionEvent, use
 					icon = ":x:"
 				}
 				if !strings.Contains(summary, "'success': True, 'command':") {
-					toolSummaries = append(toolSummaries, fmt.Sprintf("%s %s", icon, summary))
+					// Past maxListedToolSummaries only the count is reported,
+					// so stop formatting lines that would be thrown away.
+					toolSummaryCount++
+					if toolSummaryCount <= maxListedToolSummaries {
+						toolSummaries = append(toolSummaries, fmt.Sprintf("%s %s", icon, summary))
+					} else {
+						toolSummaries = nil
+					}
 				}
 			}
 		case "todo_update":
 			if len(update.Todos) > 0 {
-				status := fmt.Sprintf(":memo: Updated TODOs (%d items).", len(update.Todos))
-				b.postThreadedSlackMessage(channel, threadTS, status)
+				postStatus(fmt.Sprintf(":memo: Updated TODOs (%d items).", len(update.Todos)))
 			}
 		}
 	}
@@ -550,15 +713,17 @@ func (b *Bot) streamAgentResponseToSlack(event *slackevents.AppMentionEvent, use
 		return
 	}
 
+	finalResponse := response.String()
 	if finalResponse == "" {
 		finalResponse = "Done! Let me know if you need anything else."
 	}
 
-	if len(toolSummaries) > 0 && len(toolSummaries) <= 5 {
+	if toolSummaryCount > 0 && toolSummaryCount <= maxListedToolSummaries {
 		finalResponse = fmt.Sprintf("%s\n\n*Tool summary:*\n%s", finalResponse, strings.Join(toolSummaries, "\n"))
-	} else if len(toolSummaries) > 5 {
-		finalResponse = fmt.Sprintf("%s\n\n*Executed %d tools successfully.*", finalResponse, len(toolSummaries))
+	} else if toolSummaryCount > maxListedToolSummaries {
+		finalResponse = fmt.Sprintf("%s\n\n*Executed %d tools successfully.*", finalResponse, toolSummaryCount)
 	}
+	finalResponse = truncateText(finalResponse, maxSlackSectionText, "…")
 
 	blocks := []slack.Block{
 		slack.NewSectionBlock(
@@ -640,7 +805,16 @@ func (b *Bot) doJSON(ctx context.Context, method, url string, in any, out any) e
 	if out == nil {
 		return nil
 	}
-	return json.NewDecoder(io.LimitReader(resp.Body, 1<<20)).Decode(out)
+	// Read one byte past the cap so an oversized reply is told apart from a
+	// malformed one.
+	body := &io.LimitedReader{R: resp.Body, N: maxAgentResponseBytes + 1}
+	if err := json.NewDecoder(body).Decode(out); err != nil {
+		if body.N <= 0 {
+			return fmt.Errorf("response exceeds %d bytes", maxAgentResponseBytes)
+		}
+		return err
+	}
+	return nil
 }
 
 func (b *Bot) verifySlack(w http.ResponseWriter, r *http.Request, max int64) ([]byte, bool) {
@@ -668,71 +842,202 @@ func (b *Bot) verifySlack(w http.ResponseWriter, r *http.Request, max int64) ([]
 	return body, true
 }
 
+func (b *Bot) logSnippetLines() int {
+	if n := b.config.Diagnostics.Monitoring.LogSnippetLines; n > 0 {
+		return n
+	}
+	return defaultLogSnippetLines
+}
+
+// logFilter compiles diagnostics.monitoring.log_filter once and reuses it
+// until the configured pattern changes.
+func (b *Bot) logFilter() *regexp.Regexp {
+	src := strings.TrimSpace(b.config.Diagnostics.Monitoring.LogFilter)
+	if src == "" {
+		return nil
+	}
+
+	b.logFilterMu.Lock()
+	defer b.logFilterMu.Unlock()
+
+	if src == b.logFilterSrc {
+		return b.logFilterRe
+	}
+
+	re, err := regexp.Compile(src)
+	if err != nil {
+		b.logger.Warn("Invalid diagnostics log_filter, showing unfiltered logs", "log_filter", src, "error", err)
+	}
+	b.logFilterSrc = src
+	b.logFilterRe = re
+	return re
+}
+
+// filterLines keeps only the lines of s that contain a match for re. Matches
+// are found over the raw string and expanded to their enclosing lines.
+func filterLines(s string, re *regexp.Regexp) string {
+	var out strings.Builder
+	lineEnd := -1
+	for _, m := range re.FindAllStringIndex(s, -1) {
+		if lineEnd >= 0 && m[0] <= lineEnd {
+			continue
+		}
+		start := strings.LastIndexByte(s[:m[0]], '\n') + 1
+		end := len(s)
+		if idx := strings.IndexByte(s[m[0]:], '\n'); idx >= 0 {
+			end = m[0] + idx
+		}
+		if out.Len() > 0 {
+			out.WriteByte('\n')
+		}
+		out.WriteString(s[start:end])
+		lineEnd = end
+	}
+	return out.String()
+}
+
+// tailLines returns the last n lines of s, scanning back from the end so
+// long logs are never split into a full slice of lines.
+func tailLines(s string, n int) string {
+	s = strings.TrimRight(s, "\n")
+	idx := len(s)
+	for i := 0; i < n; i++ {
+		idx = strings.LastIndexByte(s[:idx], '\n')
+		if idx < 0 {
+			return s
+		}
+	}
+	return s[idx+1:]
+}
+
+// tailText keeps the last limit bytes of s behind prefix, starting on a rune
+// boundary. Log snippets are cut this way so the newest lines survive.
+func tailText(s string, limit int, prefix string) string {
+	if len(s) <= limit {
+		return s
+	}
+	start := len(s) - limit + len(prefix)
+	for start < len(s) && !utf8.RuneStart(s[start]) {
+		start++
+	}
+	return prefix + s[start:]
+}
+
 func mdField(title, val string) *slack.TextBlockObject {
 	return slack.NewTextBlockObject(slack.MarkdownType, fmt.Sprintf("*%s:*\n%s", title, val), false, false)
 }
 
+// postMessage sends a Slack message, spacing posts to the same channel at
+// least slackPostInterval apart per Slack's one-message-per-second guidance.
+// When Slack still answers with a rate limit it waits the advised Retry-After
+// (capped at maxSlackRetryAfter) and tries once more.
+func (b *Bot) postMessage(channel string, opts ...slack.MsgOption) (string, string, error) {
+	b.waitForSlackSlot(channel)
+
+	respChannel, ts, err := b.client.PostMessage(channel, opts...)
+	var rateErr *slack.RateLimitedError
+	if errors.As(err, &rateErr) {
+		wait := rateErr.RetryAfter
+		if wait > maxSlackRetryAfter {
+			wait = maxSlackRetryAfter
+		}
+		b.logger.Warn("Slack rate limited, retrying", "channel", channel, "retry_after", wait)
+		time.Sleep(wait)
+		return b.client.PostMessage(channel, opts...)
+	}
+	return respChannel, ts, err
+}
+
+// waitForSlackSlot reserves the next posting slot for channel and sleeps
+// until it arrives.
+func (b *Bot) waitForSlackSlot(channel string) {
+	b.slackPostMu.Lock()
+	now := time.Now()
+	if b.slackNextPost == nil {
+		b.slackNextPost = make(map[string]time.Time)
+	}
+	slot := b.slackNextPost[channel]
+	if slot.Before(now) {
+		slot = now
+	}
+	b.slackNextPost[channel] = slot.Add(slackPostInterval)
+	b.slackPostMu.Unlock()
+
+	if wait := slot.Sub(now); wait > 0 {
+		time.Sleep(wait)
+	}
+}
+
 func (b *Bot) post(channel, threadTS string, opts ...slack.MsgOption) {
 	if threadTS != "" {
 		opts = append(opts, slack.MsgOptionTS(threadTS))
 	}
-	_, _, _ = b.client.PostMessage(channel, opts...)
+	_, _, _ = b.postMessage(channel, opts...)
 }
 
 func (b *Bot) syncConfigToAgentCore() error {
 	const maxDuration = 60 * time.Second
-	
-	startTime := time.Now()
+	const attemptTimeout = 10 * time.Second
+
+	// Work against a fixed deadline so each attempt reads the clock once
+	// instead of re-deriving the elapsed time at every check.
+	deadline := time.Now().Add(maxDuration)
 	attempt := 0
 	var lastErr error
-	
-	for time.Since(startTime) < maxDuration {
+
+	for {
 		attempt++
-		
-		remainingTime := maxDuration - time.Since(startTime)
-		ctxTimeout := 10 * time.Second
-		if remainingTime < ctxTimeout {
-			ctxTimeout = remainingTime
+
+		attemptDeadline := time.Now().Add(attemptTimeout)
+		if attemptDeadline.After(deadline) {
+			attemptDeadline = deadline
 		}
-		
-		ctx, cancel := context.WithTimeout(context.Background(), ctxTimeout)
+
+		ctx, cancel := context.WithDeadline(context.Background(), attemptDeadline)
 		err := b.trySyncConfig(ctx)
 		cancel()
-		
+
 		if err == nil {
 			b.logger.Info("Config sync successful", "attempt", attempt)
 			return nil
 		}
-		
+
 		lastErr = err
-		
-		if time.Since(startTime) >= maxDuration {
-			break
-		}
-		
+
 		backoff := time.Duration(attempt) * time.Second
 		if backoff > 10*time.Second {
 			backoff = 10 * time.Second
 		}
-		if time.Since(startTime)+backoff >= maxDuration {
+		if !time.Now().Add(backoff).Before(deadline) {
 			break
 		}
-		
-		b.logger.Warn("Config sync failed, retrying", 
-			"attempt", attempt, 
-			"error", err.Error(), 
+
+		b.logger.Warn("Config sync failed, retrying",
+			"attempt", attempt,
+			"error", err.Error(),
 			"backoff", backoff)
-		
+
 		time.Sleep(backoff)
 	}
-	
-	if lastErr != nil {
-		return fmt.Errorf("sync failed after %v and %d attempts: %w", maxDuration, attempt, lastErr)
-	}
-	return fmt.Errorf("sync failed after %v and %d attempts", maxDuration, attempt)
+
+	return fmt.Errorf("sync failed after %v and %d attempts: %w", maxDuration, attempt, lastErr)
 }
 
+// buildPonosConfigPayload returns the ponos_config block sent with every agent
+// request. It only depends on b.config, so it is built once per loaded config
+// and reused until a reload swaps the config out.
 func (b *Bot) buildPonosConfigPayload() map[string]any {
+	b.ponosPayloadMu.Lock()
+	defer b.ponosPayloadMu.Unlock()
+
+	if b.ponosPayload == nil || b.ponosPayloadCfg != b.config {
+		b.ponosPayload = b.newPonosConfigPayload()
+		b.ponosPayloadCfg = b.config
+	}
+	return b.ponosPayload
+}
+
+func (b *Bot) newPonosConfigPayload() map[string]any {
 	payload := map[string]any{
 		"integrations": map[string]any{
 			"github": map[string]any{
@@ -775,9 +1080,11 @@ func (b *Bot) buildPonosConfigPayload() map[string]any {
 				"channel": b.config.Diagnostics.Slack.Channel,
 			},
 			"monitoring": map[string]any{
-				"service":       b.config.Diagnostics.Monitoring.Service,
-				"log_tail":      b.config.Diagnostics.Monitoring.LogTail,
-				"eval_interval": b.config.Diagnostics.Monitoring.EvalInterval,
+				"service":           b.config.Diagnostics.Monitoring.Service,
+				"log_tail":          b.config.Diagnostics.Monitoring.LogTail,
+				"log_snippet_lines": b.logSnippetLines(),
+				"log_filter":        b.config.Diagnostics.Monitoring.LogFilter,
+				"eval_interval":     b.config.Diagnostics.Monitoring.EvalInterval,
 			},
 		}
 		if b.config.Diagnostics.Provider == "kubernetes" {
@@ -846,34 +1153,42 @@ func (b *Bot) ProcessReleaseUpdate(ctx context.Context, payload ReleasesWebhookP
 	return &result, nil
 }
 
-func (b *Bot) ExtractImages(ctx context.Context, yamlContent string) ([]string, error) {
-	prompt := fmt.Sprintf(`You are a blockchain infrastructure expert. Analyze this YAML file and identify ONLY the main blockchain node containers.
+// extractImagesPromptTemplate asks the agent for the main node images in a
+// YAML file; its single verb is the file content.
+const extractImagesPromptTemplate = `You are a blockchain infrastructure expert. Analyze this YAML file and identify ONLY the main blockchain node containers.
 
 YAML Content:
 %s
 
 Return only a JSON array of image repository names (without tags): ["repo1/image1", "repo2/image2"]
-If no blockchain containers found, return: []`, yamlContent)
+If no blockchain containers found, return: []`
+
+func (b *Bot) ExtractImages(ctx context.Context, yamlContent string) ([]string, error) {
+	prompt := fmt.Sprintf(extractImagesPromptTemplate, yamlContent)
 
 	request := map[string]any{
 		"message": prompt,
 		"context": map[string]any{
 			"source":    "ponos-yaml-analysis",
-			"timestamp": time.Now().Format(time.RFC3339),
+			"timestamp": requestTimestamp(),
 			"user_type": "blockchain_operator",
 		},
 	}
 
 	url := fmt.Sprintf("%s/agent/simple", b.agentCoreURL)
-	var response map[string]any
+	// Only content is read, so decode into a typed struct rather than a
+	// generic map and let the decoder skip the rest of the reply.
+	var response struct {
+		Content *string `json:"content"`
+	}
 	if err := b.doJSON(ctx, "POST", url, request, &response); err != nil {
 		return nil, fmt.Errorf("Nodeoperator API request failed: %w", err)
 	}
 
-	content, ok := response["content"].(string)
-	if !ok {
+	if response.Content == nil {
 		return nil, fmt.Errorf("invalid response format from Nodeoperator API")
 	}
+	content := *response.Content
 
 	var repos []string
 	if err := b.extractAndUnmarshalJSON(content, &repos); err != nil {
@@ -883,20 +1198,24 @@ If no blockchain containers found, return: []`, yamlContent)
 	return repos, nil
 }
 
+// agentCapabilities is advertised with every streamed conversation. It is
+// only ever marshalled, so one shared slice serves all requests.
+var agentCapabilities = []string{
+	"network_upgrades",
+	"file_operations",
+	"system_commands",
+	"blockchain_analysis",
+}
+
 func (b *Bot) StreamConversation(ctx context.Context, userMessage string, conversationHistory []map[string]string, updates chan<- StreamingUpdate) error {
 
 	request := map[string]any{
 		"message": userMessage,
 		"context": map[string]any{
-			"source":    "ponos-bot",
-			"timestamp": time.Now().Format(time.RFC3339),
-			"user_type": "blockchain_operator",
-			"capabilities": []string{
-				"network_upgrades",
-				"file_operations",
-				"system_commands",
-				"blockchain_analysis",
-			},
+			"source":       "ponos-bot",
+			"timestamp":    requestTimestamp(),
+			"user_type":    "blockchain_operator",
+			"capabilities": agentCapabilities,
 		},
 		"ponos_config": b.buildPonosConfigPayload(),
 	}
@@ -938,37 +1257,97 @@ func (b *Bot) StreamConversation(ctx context.Context, userMessage string, conver
 	return b.processStreamingResponse(resp.Body, updates)
 }
 
+var streamDataPrefix = []byte("data: ")
+
+// streamEvent is one agent-core SSE event. Decoding into it reads only the
+// fields the bot uses instead of building a generic map per event. Fields use
+// the loose types below so one mistyped field is zeroed rather than failing
+// the whole event, the way the old map decode behaved.
+type streamEvent struct {
+	Type         looseString `json:"type"`
+	Message      looseString `json:"message"`
+	Tool         looseString `json:"tool"`
+	Success      looseBool   `json:"success"`
+	Summary      looseString `json:"summary"`
+	Todos        streamTodos `json:"todos"`
+	ToolName     looseString `json:"tool_name"`
+	SessionID    looseString `json:"session_id"`
+	CheckpointID looseString `json:"checkpoint_id"`
+}
+
+// streamTodo matches TodoItem but uses the camelCase key agent-core streams.
+type streamTodo struct {
+	Content    looseString `json:"content"`
+	Status     looseString `json:"status"`
+	ActiveForm looseString `json:"activeForm"`
+}
+
+// looseString holds a JSON string; values of any other type decode as "".
+type looseString string
+
+func (s *looseString) UnmarshalJSON(data []byte) error {
+	var v string
+	if len(data) > 0 && data[0] == '"' && json.Unmarshal(data, &v) == nil {
+		*s = looseString(v)
+	}
+	return nil
+}
+
+// looseBool holds a JSON boolean; values of any other type decode as false.
+type looseBool bool
+
+func (v *looseBool) UnmarshalJSON(data []byte) error {
+	*v = looseBool(bytes.Equal(data, []byte("true")))
+	return nil
+}
+
+// streamTodos decodes the todo list, skipping entries that aren't objects
+// and ignoring a todos value that isn't an array.
+type streamTodos []streamTodo
+
+func (t *streamTodos) UnmarshalJSON(data []byte) error {
+	var items []json.RawMessage
+	if json.Unmarshal(data, &items) != nil {
+		return nil
+	}
+	todos := make(streamTodos, 0, len(items))
+	for _, item := range items {
+		var todo streamTodo
+		if len(item) > 0 && item[0] == '{' && json.Unmarshal(item, &todo) == nil {
+			todos = append(todos, todo)
+		}
+	}
+	*t = todos
+	return nil
+}
+
 func (b *Bot) processStreamingResponse(body io.Reader, updates chan<- StreamingUpdate) error {
 	scanner := bufio.NewScanner(body)
 	scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
 	var assistantMessageID string
 
 	for scanner.Scan() {
-		line := scanner.Text()
-		if !strings.HasPrefix(line, "data: ") {
+		// Bytes avoids a string copy per line; the slice is only valid until
+		// the next Scan, which is fine since it is decoded right away.
+		line := scanner.Bytes()
+		if !bytes.HasPrefix(line, streamDataPrefix) {
 			continue
 		}
 
-		dataStr := strings.TrimPrefix(line, "data: ")
-		var streamEvent map[string]any
-
-		if err := json.Unmarshal([]byte(dataStr), &streamEvent); err != nil {
+		var event streamEvent
+		if err := json.Unmarshal(line[len(streamDataPrefix):], &event); err != nil {
 			b.logger.Warn("Failed to parse stream event", "error", err)
 			continue
 		}
 
-		eventType, ok := streamEvent["type"].(string)
-		if !ok {
-			continue
-		}
-
-		message, _ := streamEvent["message"].(string)
+		message := string(event.Message)
+		tool := string(event.Tool)
 
-		switch eventType {
+		switch event.Type {
 		case "thinking":
 			updates <- StreamingUpdate{Type: "thinking", Message: message}
 		case "tool_start":
-			if tool, ok := streamEvent["tool"].(string); ok {
+			if tool != "" {
 				updates <- StreamingUpdate{
 					Type:    "tool_start",
 					Message: fmt.Sprintf("Running %s", tool),
@@ -976,15 +1355,13 @@ func (b *Bot) processStreamingResponse(body io.Reader, updates chan<- StreamingU
 				}
 			}
 		case "tool_result":
-			if tool, ok := streamEvent["tool"].(string); ok {
-				success, _ := streamEvent["success"].(bool)
-				summary, _ := streamEvent["summary"].(string)
+			if tool != "" {
 				updates <- StreamingUpdate{
 					Type:    "tool_result",
 					Message: fmt.Sprintf("%s completed", tool),
 					Tool:    tool,
-					Success: success,
-					Summary: summary,
+					Success: bool(event.Success),
+					Summary: string(event.Summary),
 				}
 			}
 		case "assistant":
@@ -1007,33 +1384,25 @@ func (b *Bot) processStreamingResponse(body io.Reader, updates chan<- StreamingU
 			updates <- StreamingUpdate{Type: "status", Message: message}
 		case "todo_update":
 			var todos []TodoItem
-			if todosInterface, ok := streamEvent["todos"].([]any); ok {
-				for _, todoInterface := range todosInterface {
-					if todoMap, ok := todoInterface.(map[string]any); ok {
-						todo := TodoItem{
-							Content:    b.getStringFromMap(todoMap, "content"),
-							Status:     b.getStringFromMap(todoMap, "status"),
-							ActiveForm: b.getStringFromMap(todoMap, "activeForm"),
-						}
-						todos = append(todos, todo)
-					}
-				}
+			for _, todo := range event.Todos {
+				todos = append(todos, TodoItem{
+					Content:    string(todo.Content),
+					Status:     string(todo.Status),
+					ActiveForm: string(todo.ActiveForm),
+				})
 			}
-			toolName, _ := streamEvent["tool_name"].(string)
 			updates <- StreamingUpdate{
 				Type:     "todo_update",
 				Message:  message,
 				Todos:    todos,
-				ToolName: toolName,
+				ToolName: string(event.ToolName),
 			}
 		case "complete":
-			sessionID, _ := streamEvent["session_id"].(string)
-			checkpointID, _ := streamEvent["checkpoint_id"].(string)
 			updates <- StreamingUpdate{
 				Type:         "complete",
 				Message:      "Operation completed",
-				SessionID:    sessionID,
-				CheckpointID: checkpointID,
+				SessionID:    string(event.SessionID),
+				CheckpointID: string(event.CheckpointID),
 			}
 		case "error":
 			return fmt.Errorf("Nodeoperator API error: %s", message)
@@ -1046,17 +1415,14 @@ func (b *Bot) processStreamingResponse(body io.Reader, updates chan<- StreamingU
 func (b *Bot) extractAndUnmarshalJSON(input string, target any) error {
 	input = strings.TrimSpace(input)
 
-	// Handle markdown code blocks
+	// Handle markdown code blocks by slicing off the fence lines in place
 	if strings.HasPrefix(input, "```") {
-		lines := strings.Split(input, "\n")
-		if len(lines) >= 2 {
-			if strings.HasPrefix(lines[0], "```") {
-				lines = lines[1:]
-			}
-			if len(lines) > 0 && strings.HasPrefix(lines[len(lines)-1], "```") {
-				lines = lines[:len(lines)-1]
+		if nl := strings.IndexByte(input, '\n'); nl != -1 {
+			input = input[nl+1:]
+			last := strings.LastIndexByte(input, '\n')
+			if strings.HasPrefix(input[last+1:], "```") {
+				input = input[:max(last, 0)]
 			}
-			input = strings.Join(lines, "\n")
 		}
 	}
 
@@ -1076,11 +1442,8 @@ func (b *Bot) extractAndUnmarshalJSON(input string, target any) error {
 	return json.Unmarshal([]byte(jsonStr), target)
 }
 
-func (b *Bot) getStringFromMap(m map[string]any, key string) string {
-	if val, ok := m[key]; ok && val != nil {
-		if str, ok := val.(string); ok {
-			return str
-		}
-	}
-	return ""
+// requestTimestamp stamps agent-core requests in UTC so the value does not
+// depend on the host's local timezone.
+func requestTimestamp() string {
+	return time.Now().UTC().Format(time.RFC3339)
 }
@@ -20,32 +20,36 @@ func NewDockerOperations() *DockerOperations {
 func (d *DockerOperations) FetchLatestStableTagsMCP(ctx context.Context, mcpClient *GitHubMCPClient, agent AgentClient, filesToUpdate []fileInfo, network, client string) (*dockerTagResult, error) {
 	imageToTag := make(map[string]string)
 
-	for _, f := range filesToUpdate {
-		content, ferr := mcpClient.GetFileContent(ctx, f.owner, f.repo, f.path)
-		if ferr != nil {
-			continue
-		}
-		images, err := agent.ExtractImages(ctx, content)
-		if err != nil {
+	contents, fetchErrs := mcpClient.GetFileContents(ctx, filesToUpdate)
+	fileImages, extractErrs := extractImagesBatch(ctx, agent, contents, fetchErrs)
+
+	for i := range filesToUpdate {
+		if fetchErrs[i] != nil || extractErrs[i] != nil {
 			continue
 		}
-		for _, img := range images {
+		for _, img := range fileImages[i] {
 			imageToTag[img] = ""
 		}
 	}
 
-	for img := range imageToTag {
-		tag, err := d.fetchLatestTagFromNodeReleases(network, client)
-		if err != nil {
-			continue
+	// The lookup only depends on network and client, so one answer covers
+	// every image; skip it entirely when no images were found.
+	if len(imageToTag) > 0 {
+		if tag, err := d.fetchLatestTagFromNodeReleases(ctx, network, client); err == nil {
+			for img := range imageToTag {
+				imageToTag[img] = tag
+			}
 		}
-		imageToTag[img] = tag
 	}
 
-	return &dockerTagResult{ImageToTag: imageToTag}, nil
+	return &dockerTagResult{ImageToTag: imageToTag, Contents: contents, FetchErrs: fetchErrs}, nil
 }
 
-func (d *DockerOperations) fetchLatestTagFromNodeReleases(network, client string) (string, error) {
+// nodeReleasesTimeout bounds each node-releases lookup so a slow API can't
+// hold up the release update that is waiting on it.
+const nodeReleasesTimeout = 15 * time.Second
+
+func (d *DockerOperations) fetchLatestTagFromNodeReleases(ctx context.Context, network, client string) (string, error) {
 	baseURL := os.Getenv("NODE_RELEASES_API_BASE_URL")
 	if baseURL == "" {
 		baseURL = "https://api.nodereleases.com"
@@ -63,7 +67,10 @@ func (d *DockerOperations) fetchLatestTagFromNodeReleases(network, client string
 	}
 	releasesURL.RawQuery = query.Encode()
 
-	req, err := http.NewRequestWithContext(ctxWithTimeout(), http.MethodGet, releasesURL.String(), nil)
+	reqCtx, cancel := context.WithTimeout(ctx, nodeReleasesTimeout)
+	defer cancel()
+
+	req, err := http.NewRequestWithContext(reqCtx, http.MethodGet, releasesURL.String(), nil)
 	if err != nil {
 		return "", err
 	}
@@ -96,7 +103,7 @@ func (d *DockerOperations) fetchLatestTagFromNodeReleases(network, client string
 
 	if len(apiResp.Releases) == 0 {
 		if client != "" {
-			return d.fetchLatestTagFromNodeReleases(network, "")
+			return d.fetchLatestTagFromNodeReleases(ctx, network, "")
 		}
 		return "", fmt.Errorf("node-releases API returned no releases for network=%s", network)
 	}
@@ -108,13 +115,8 @@ func (d *DockerOperations) fetchLatestTagFromNodeReleases(network, client string
 	}
 
 	if client != "" {
-		return d.fetchLatestTagFromNodeReleases(network, "")
+		return d.fetchLatestTagFromNodeReleases(ctx, network, "")
 	}
 
 	return "", fmt.Errorf("docker tag not found for network=%s client=%s", network, client)
 }
-
-func ctxWithTimeout() context.Context {
-	ctx, _ := context.WithTimeout(context.Background(), 15*time.Second)
-	return ctx
-}
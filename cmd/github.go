@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"log/slog"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/blockops-sh/ponos/config"
@@ -37,6 +38,8 @@ type FileUpdate struct {
 
 type dockerTagResult struct {
 	ImageToTag map[string]string
+	Contents   []string
+	FetchErrs  []error
 	Error      error
 }
 
@@ -60,15 +63,18 @@ type NetworkUpdateResult struct {
 }
 
 func NewGitHubDeployHandler(logger *slog.Logger, cfg *config.Config, slackClient SlackClient, agent AgentClient, mcpClient *GitHubMCPClient) *GitHubDeployHandler {
-	return &GitHubDeployHandler{
-		logger:    logger,
-		config:    cfg,
-		slack:     slackClient,
-		agent:     agent,
-		mcpClient: mcpClient,
-		docker:    NewDockerOperations(),
-		yaml:      NewYAMLOperations(),
+	h := &GitHubDeployHandler{
+		logger:      logger,
+		config:      cfg,
+		slack:       slackClient,
+		agent:       agent,
+		mcpClient:   mcpClient,
+		docker:      NewDockerOperations(),
+		yaml:        NewYAMLOperations(),
+		prCachePath: defaultPRCachePath(),
 	}
+	h.loadPRCache()
+	return h
 }
 
 func (h *GitHubDeployHandler) updateNetworkImages(ctx context.Context, req NetworkUpdateRequest) (*NetworkUpdateResult, error) {
@@ -103,8 +109,23 @@ func (h *GitHubDeployHandler) updateNetworkImages(ctx context.Context, req Netwo
 		}
 	}
 
+	// Identical requests are recognised before anything is fetched, so a
+	// repeated or concurrent webhook neither refetches files nor opens a
+	// second pull request while the first is still being made.
+	key := newUpdateKey(req.ReleaseTag, filesToUpdate)
+	return h.coalesceUpdate(ctx, key, req.ReleaseTag != "", func() (*NetworkUpdateResult, error) {
+		return h.runNetworkUpdate(ctx, req, filesToUpdate)
+	})
+}
+
+func (h *GitHubDeployHandler) runNetworkUpdate(ctx context.Context, req NetworkUpdateRequest, filesToUpdate []fileInfo) (*NetworkUpdateResult, error) {
+	result := &NetworkUpdateResult{}
 	imageToTag := make(map[string]string)
 
+	// When the tag lookup already pulled the files, pass them on instead of
+	// fetching every file a second time.
+	var contents []string
+	var fetchErrs []error
 	if req.ReleaseTag == "" {
 		primaryNetwork := req.DetectedNetworks[0]
 		dockerResult, err := h.docker.FetchLatestStableTagsMCP(ctx, h.mcpClient, h.agent, filesToUpdate, primaryNetwork, "")
@@ -112,9 +133,10 @@ func (h *GitHubDeployHandler) updateNetworkImages(ctx context.Context, req Netwo
 			return result, err
 		}
 		imageToTag = dockerResult.ImageToTag
+		contents, fetchErrs = dockerResult.Contents, dockerResult.FetchErrs
 	}
 
-	filesToCommit, upgrades, err := h.prepareFileUpdatesMCP(ctx, filesToUpdate, imageToTag, req.ReleaseTag)
+	filesToCommit, upgrades, err := h.prepareFileUpdatesMCP(ctx, filesToUpdate, contents, fetchErrs, imageToTag, req.ReleaseTag)
 	if err != nil {
 		return result, err
 	}
@@ -126,6 +148,16 @@ func (h *GitHubDeployHandler) updateNetworkImages(ctx context.Context, req Netwo
 	owner := filesToCommit[0].owner
 	repo := filesToCommit[0].repo
 
+	cacheKey := newPRCacheKey(owner, repo, filesToCommit)
+	if cached, ok := h.cachedPR(cacheKey); ok {
+		h.logger.Info("Identical update already has a pull request, skipping", "owner", owner, "repo", repo, "pr_url", cached.prURL)
+		result.PRUrl = cached.prURL
+		result.CommitURL = cached.commitURL
+		result.ImageUpgrades = upgrades
+		result.Success = true
+		return result, nil
+	}
+
 	branchName := h.generateBranchName(req, filesToCommit[0])
 	err = h.mcpClient.CreateBranch(ctx, owner, repo, branchName)
 	if err != nil {
@@ -147,6 +179,8 @@ func (h *GitHubDeployHandler) updateNetworkImages(ctx context.Context, req Netwo
 	result.ImageUpgrades = upgrades
 	result.Success = true
 
+	h.storePR(cacheKey, prCacheEntry{prURL: result.PRUrl, commitURL: result.CommitURL, created: time.Now()})
+
 	return result, nil
 }
 
@@ -206,39 +240,50 @@ func (h *GitHubDeployHandler) notifyError(channelID, message string) {
 	}
 }
 
-func (h *GitHubDeployHandler) prepareFileUpdatesMCP(ctx context.Context, filesToUpdate []fileInfo, imageToTag map[string]string, releaseTag string) ([]fileCommitData, []imageUpgrade, error) {
+func (h *GitHubDeployHandler) prepareFileUpdatesMCP(ctx context.Context, filesToUpdate []fileInfo, contents []string, fetchErrs []error, imageToTag map[string]string, releaseTag string) ([]fileCommitData, []imageUpgrade, error) {
 	var filesToCommit []fileCommitData
 	var upgrades []imageUpgrade
 
-	for _, f := range filesToUpdate {
-		content, err := h.mcpClient.GetFileContent(ctx, f.owner, f.repo, f.path)
-		if err != nil {
+	if contents == nil {
+		contents, fetchErrs = h.mcpClient.GetFileContents(ctx, filesToUpdate)
+	}
+
+	var fileImages [][]string
+	var extractErrs []error
+	if releaseTag != "" {
+		fileImages, extractErrs = extractImagesBatch(ctx, h.agent, contents, fetchErrs)
+	}
+
+	for i, f := range filesToUpdate {
+		if fetchErrs[i] != nil {
 			continue
 		}
+		content := contents[i]
 
 		currentImageToTag := imageToTag
 		if releaseTag != "" {
-			images, err := h.agent.ExtractImages(ctx, content)
-			if err != nil {
+			if err := extractErrs[i]; err != nil {
 				h.logger.Warn("Failed to extract images from YAML", "error", err, "file", f.path)
 				continue
 			}
 			currentImageToTag = make(map[string]string)
-			for _, img := range images {
+			for _, img := range fileImages[i] {
 				currentImageToTag[img] = releaseTag
 			}
 		}
 
-		newYAML, updated, uerr := h.yaml.UpdateAllImageTagsYAML(content, currentImageToTag)
+		newYAML, fileUpgrades, uerr := h.yaml.UpdateAllImageTagsYAML(content, currentImageToTag)
 		if uerr != nil {
 			continue
 		}
-		if !updated {
+		if len(fileUpgrades) == 0 {
 			continue
 		}
 
-		fileUpgrades := h.trackImageUpgrades(content, currentImageToTag, f.path)
-		upgrades = append(upgrades, fileUpgrades...)
+		for _, u := range fileUpgrades {
+			u.file = f.path
+			upgrades = append(upgrades, u)
+		}
 
 		filesToCommit = append(filesToCommit, fileCommitData{
 			owner:   f.owner,
@@ -251,6 +296,29 @@ func (h *GitHubDeployHandler) prepareFileUpdatesMCP(ctx context.Context, filesTo
 	return filesToCommit, upgrades, nil
 }
 
+// extractImagesBatch asks the agent for the images in each file concurrently,
+// skipping files whose fetch already failed. Results keep the input order.
+func extractImagesBatch(ctx context.Context, agent AgentClient, contents []string, fetchErrs []error) ([][]string, []error) {
+	images := make([][]string, len(contents))
+	errs := make([]error, len(contents))
+
+	var wg sync.WaitGroup
+	for i, content := range contents {
+		if fetchErrs[i] != nil {
+			errs[i] = fetchErrs[i]
+			continue
+		}
+		wg.Add(1)
+		go func(i int, content string) {
+			defer wg.Done()
+			images[i], errs[i] = agent.ExtractImages(ctx, content)
+		}(i, content)
+	}
+	wg.Wait()
+
+	return images, errs
+}
+
 func (h *GitHubDeployHandler) createCommitFromFilesMCP(ctx context.Context, owner, repo, branch string, filesToCommit []fileCommitData, commitMsg string) (string, error) {
 	var files []FileUpdate
 	for _, f := range filesToCommit {
@@ -263,31 +331,6 @@ func (h *GitHubDeployHandler) createCommitFromFilesMCP(ctx context.Context, owne
 	return h.mcpClient.CreateCommit(ctx, owner, repo, branch, commitMsg, files)
 }
 
-func (h *GitHubDeployHandler) trackImageUpgrades(yamlContent string, imageToTag map[string]string, filePath string) []imageUpgrade {
-	var upgrades []imageUpgrade
-
-	// Extract current images from YAML
-	currentImages := h.yaml.ExtractImageReposFromYAML(yamlContent)
-
-	for _, img := range currentImages {
-		if strings.Contains(img, ":") {
-			repo := img[:strings.Index(img, ":")]
-			if newTag, ok := imageToTag[repo]; ok {
-				newImg := repo + ":" + newTag
-				if img != newImg {
-					upgrades = append(upgrades, imageUpgrade{
-						file:   filePath,
-						oldImg: img,
-						newImg: newImg,
-					})
-				}
-			}
-		}
-	}
-
-	return upgrades
-}
-
 func (h *GitHubDeployHandler) generateBranchName(req NetworkUpdateRequest, fileCommit fileCommitData) string {
 	networkName := "network"
 	if len(req.DetectedNetworks) > 0 {
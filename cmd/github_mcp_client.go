@@ -8,15 +8,18 @@ import (
 	"crypto/x509"
 	"encoding/json"
 	"encoding/pem"
+	"errors"
 	"fmt"
 	"io"
 	"log/slog"
+	"math/rand"
 	"net"
 	"net/http"
 	"net/url"
 	"os"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/blockops-sh/ponos/config"
@@ -34,6 +37,7 @@ const (
 	keepAliveTimeout      = 30 * time.Second
 	expectContinueTimeout = 5 * time.Second
 	idleConnTimeout       = 90 * time.Second
+	maxIdleConnsPerHost   = 16
 	initializeTimeout     = 30 * time.Second
 	defaultLocalhost      = "http://localhost:3001"
 	jsonRPCVersion        = "2.0"
@@ -41,6 +45,16 @@ const (
 	gitHubConflictStatus  = "422"
 	rateLimitRemaining    = "X-RateLimit-Remaining"
 	rateLimitReset        = "X-RateLimit-Reset"
+	maxRetainedSSEBuffer  = 1 << 20
+	toolNamesTTL          = 10 * time.Minute
+	batchExecuteTool      = "batch_execute"
+	batchMaxConcurrent    = 4
+	minWriteInterval      = 1 * time.Second
+)
+
+var (
+	sseEventField = []byte("event:")
+	sseDataField  = []byte("data:")
 )
 
 func BuildGitHubMCPClient(cfg *config.Config, logger *slog.Logger) *GitHubMCPClient {
@@ -60,6 +74,11 @@ type ToolCallParams struct {
 	Arguments map[string]interface{} `json:"arguments"`
 }
 
+type ToolCallResult struct {
+	Result map[string]interface{}
+	Err    error
+}
+
 func NewGitHubMCPClient(serverURL, token, appID, installID, pemKey, botName string, logger *slog.Logger) *GitHubMCPClient {
 	clientName := "ponos"
 	if botName != "" {
@@ -78,7 +97,10 @@ func NewGitHubMCPClient(serverURL, token, appID, installID, pemKey, botName stri
 		ResponseHeaderTimeout: defaultRequestTimeout,
 		ExpectContinueTimeout: expectContinueTimeout,
 		IdleConnTimeout:       idleConnTimeout,
-		Proxy:                 http.ProxyFromEnvironment,
+		// Batched tool calls POST to the same host concurrently; keep those
+		// connections warm instead of the default two per host.
+		MaxIdleConnsPerHost: maxIdleConnsPerHost,
+		Proxy:               http.ProxyFromEnvironment,
 	}
 
 	client := &GitHubMCPClient{
@@ -127,17 +149,44 @@ func normalizeServerURL(serverURL string) (string, string) {
 }
 
 func (g *GitHubMCPClient) GetFileContent(ctx context.Context, owner, repo, path string) (string, error) {
-	args := map[string]interface{}{
+	result, err := g.CallTool(ctx, "get_file_contents", fileContentArgs(owner, repo, path))
+	if err != nil {
+		return "", fmt.Errorf("failed to get file contents: %v", err)
+	}
+
+	return fileContentFromResult(result)
+}
+
+// GetFileContents fetches several files in one batch; contents and errors are
+// returned in the same order as files.
+func (g *GitHubMCPClient) GetFileContents(ctx context.Context, files []fileInfo) ([]string, []error) {
+	calls := make([]ToolCallParams, len(files))
+	for i, f := range files {
+		calls[i] = ToolCallParams{Name: "get_file_contents", Arguments: fileContentArgs(f.owner, f.repo, f.path)}
+	}
+
+	contents := make([]string, len(files))
+	errs := make([]error, len(files))
+	for i, res := range g.CallToolBatch(ctx, calls) {
+		if res.Err != nil {
+			errs[i] = fmt.Errorf("failed to get file contents: %v", res.Err)
+			continue
+		}
+		contents[i], errs[i] = fileContentFromResult(res.Result)
+	}
+
+	return contents, errs
+}
+
+func fileContentArgs(owner, repo, path string) map[string]interface{} {
+	return map[string]interface{}{
 		"owner": owner,
 		"repo":  repo,
 		"path":  path,
 	}
+}
 
-	result, err := g.CallTool(ctx, "get_file_contents", args)
-	if err != nil {
-		return "", fmt.Errorf("failed to get file contents: %v", err)
-	}
-
+func fileContentFromResult(result map[string]interface{}) (string, error) {
 	if contentArray, ok := result["content"].([]interface{}); ok {
 		for _, item := range contentArray {
 			if itemMap, ok := item.(map[string]interface{}); ok {
@@ -192,19 +241,13 @@ func (g *GitHubMCPClient) CreateCommit(ctx context.Context, owner, repo, branch,
 		return "", fmt.Errorf("failed to push files: %v", err)
 	}
 
-	if content, ok := result["content"].([]interface{}); ok && len(content) > 0 {
-		if firstItem, ok := content[0].(map[string]interface{}); ok {
-			if textData, ok := firstItem["text"].(string); ok {
-				var gitResponse map[string]interface{}
-				if json.Unmarshal([]byte(textData), &gitResponse) == nil {
-					if object, ok := gitResponse["object"].(map[string]interface{}); ok {
-						if sha, ok := object["sha"].(string); ok {
-							return sha, nil
-						}
-					}
-				}
-			}
-		}
+	var gitResponse struct {
+		Object struct {
+			SHA string `json:"sha"`
+		} `json:"object"`
+	}
+	if decodeToolText(result, &gitResponse) == nil && gitResponse.Object.SHA != "" {
+		return gitResponse.Object.SHA, nil
 	}
 
 	return "", fmt.Errorf("commit SHA not found in response")
@@ -225,22 +268,48 @@ func (g *GitHubMCPClient) CreatePullRequest(ctx context.Context, owner, repo, he
 		return "", fmt.Errorf("failed to create pull request: %v", err)
 	}
 
-	if content, ok := result["content"].([]interface{}); ok && len(content) > 0 {
-		if firstItem, ok := content[0].(map[string]interface{}); ok {
-			if textData, ok := firstItem["text"].(string); ok {
-				var prResponse map[string]interface{}
-				if json.Unmarshal([]byte(textData), &prResponse) == nil {
-					if url, ok := prResponse["url"].(string); ok {
-						return url, nil
-					}
-				}
-			}
+	// html_url, url and number come out of the same decode; the web URL is
+	// preferred over the API one when the server returns both.
+	var prResponse struct {
+		HTMLURL string `json:"html_url"`
+		URL     string `json:"url"`
+		Number  int    `json:"number"`
+	}
+	if decodeToolText(result, &prResponse) == nil {
+		prURL := prResponse.HTMLURL
+		if prURL == "" {
+			prURL = prResponse.URL
+		}
+		if prURL != "" {
+			g.logger.Debug("created pull request", "owner", owner, "repo", repo, "number", prResponse.Number, "url", prURL)
+			return prURL, nil
 		}
 	}
 
 	return "", fmt.Errorf("PR URL not found in response")
 }
 
+// decodeToolText unmarshals the JSON document carried in the first text block
+// of a tool result straight into target, so callers only pick the fields they need.
+func decodeToolText(result map[string]interface{}, target interface{}) error {
+	content, ok := result["content"].([]interface{})
+	if !ok || len(content) == 0 {
+		return fmt.Errorf("tool result has no content")
+	}
+
+	firstItem, ok := content[0].(map[string]interface{})
+	if !ok {
+		return fmt.Errorf("unexpected tool content type %T", content[0])
+	}
+
+	textData, ok := firstItem["text"].(string)
+	if !ok {
+		return fmt.Errorf("tool content has no text")
+	}
+
+	return json.Unmarshal([]byte(textData), target)
+}
+
 func (g *GitHubMCPClient) UpdateFile(ctx context.Context, owner, repo, path, content, message, branch string) error {
 	args := map[string]interface{}{
 		"owner":   owner,
@@ -266,6 +335,7 @@ func (g *GitHubMCPClient) connectAndInitialize() error {
 	if err := g.initializeSession(); err != nil {
 		return err
 	}
+	g.sessionGen.Add(1)
 	g.logger.Info("MCP client initialized successfully", "session", g.sessionID)
 	return nil
 }
@@ -395,7 +465,7 @@ func (g *GitHubMCPClient) ensureConnected() error {
 
 func (g *GitHubMCPClient) sendRequest(ctx context.Context, request MCPRequest) (mcpEnvelope, error) {
 	if err := g.ensureConnected(); err != nil {
-		return mcpEnvelope{}, err
+		return mcpEnvelope{}, &notSentError{err}
 	}
 
 	if request.ID == 0 {
@@ -404,28 +474,30 @@ func (g *GitHubMCPClient) sendRequest(ctx context.Context, request MCPRequest) (
 
 	payload, err := json.Marshal(request)
 	if err != nil {
-		return mcpEnvelope{}, fmt.Errorf("failed to marshal MCP request: %w", err)
+		return mcpEnvelope{}, &notSentError{fmt.Errorf("failed to marshal MCP request: %w", err)}
 	}
 
+	// One budget covers both the POST and the wait for the SSE reply, so a
+	// stalled server can't hold a call past requestTimeout.
+	callCtx, cancel := context.WithTimeout(ctx, g.requestTimeout)
+	defer cancel()
+
 	respCh := g.registerPending(request.ID)
 
-	if err := g.postMessage(payload); err != nil {
+	if err := g.postMessage(callCtx, payload); err != nil {
 		g.removePending(request.ID)
 		return mcpEnvelope{}, err
 	}
 
-	waitCtx, cancel := context.WithTimeout(ctx, g.requestTimeout)
-	defer cancel()
-
 	select {
 	case resp, ok := <-respCh:
 		if !ok {
-			return mcpEnvelope{}, fmt.Errorf("response channel closed for request %d", request.ID)
+			return mcpEnvelope{}, fmt.Errorf("MCP request %d (%s) interrupted: %w", request.ID, request.Method, errStreamClosed)
 		}
 		return resp, nil
-	case <-waitCtx.Done():
+	case <-callCtx.Done():
 		g.removePending(request.ID)
-		return mcpEnvelope{}, waitCtx.Err()
+		return mcpEnvelope{}, fmt.Errorf("MCP request %d (%s) did not complete: %w", request.ID, request.Method, callCtx.Err())
 	}
 }
 
@@ -446,12 +518,12 @@ func (g *GitHubMCPClient) removePending(id int) {
 	g.pendingMu.Unlock()
 }
 
-func (g *GitHubMCPClient) postMessage(payload []byte) error {
+func (g *GitHubMCPClient) postMessage(ctx context.Context, payload []byte) error {
 	if g.messagesURL == "" {
 		return fmt.Errorf("MCP message endpoint not ready")
 	}
 
-	req, err := http.NewRequest(http.MethodPost, g.messagesURL, bytes.NewReader(payload))
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost, g.messagesURL, bytes.NewReader(payload))
 	if err != nil {
 		return fmt.Errorf("failed to create POST request: %w", err)
 	}
@@ -490,20 +562,361 @@ func (g *GitHubMCPClient) CallTool(ctx context.Context, toolName string, args ma
 		args = make(map[string]interface{})
 	}
 
-	result, err := g.callToolOnce(ctx, toolName, args)
+	gen := g.sessionGen.Load()
+	result, err := g.callToolWithBackoff(ctx, toolName, args)
 	if err == nil {
 		return result, nil
 	}
+	if !reconnectable(ctx, err) {
+		g.logger.Warn("MCP tool call failed", "tool", toolName, "error", err)
+		return nil, err
+	}
 
 	g.logger.Warn("MCP tool call failed, attempting reconnect", "tool", toolName, "error", err)
-	if err := g.reconnect(); err != nil {
+	if err := g.reconnect(gen); err != nil {
 		return nil, fmt.Errorf("failed to reconnect MCP client: %w", err)
 	}
 
 	return g.callToolOnce(ctx, toolName, args)
 }
 
+// ToolNames returns the tools advertised by the MCP server. The list survives
+// reconnects since the server's catalog rarely changes; it is refreshed after
+// toolNamesTTL or when the server sends notifications/tools/list_changed.
+func (g *GitHubMCPClient) ToolNames(ctx context.Context) (map[string]struct{}, error) {
+	g.toolsMu.Lock()
+	cached := g.toolNames
+	fresh := time.Since(g.toolNamesAt) < toolNamesTTL
+	g.toolsMu.Unlock()
+	if cached != nil && fresh {
+		return cached, nil
+	}
+
+	names := make(map[string]struct{})
+	cursor := ""
+	for {
+		params := map[string]interface{}{}
+		if cursor != "" {
+			params["cursor"] = cursor
+		}
+
+		resp, err := g.sendRequest(ctx, MCPRequest{
+			JSONRPC: jsonRPCVersion,
+			Method:  "tools/list",
+			Params:  params,
+		})
+		if err != nil {
+			return nil, err
+		}
+		if resp.Error != nil {
+			return nil, &mcpError{Code: resp.Error.Code, Message: resp.Error.Message}
+		}
+
+		var page struct {
+			Tools []struct {
+				Name string `json:"name"`
+			} `json:"tools"`
+			NextCursor string `json:"nextCursor"`
+		}
+		if err := decodeEnvelopeResult(resp, &page); err != nil {
+			return nil, fmt.Errorf("failed to decode tools list: %w", err)
+		}
+		for _, tool := range page.Tools {
+			names[tool.Name] = struct{}{}
+		}
+
+		if page.NextCursor == "" {
+			break
+		}
+		cursor = page.NextCursor
+	}
+
+	g.toolsMu.Lock()
+	g.toolNames = names
+	g.toolNamesAt = time.Now()
+	g.toolsMu.Unlock()
+	return names, nil
+}
+
+// HasTool reports whether the MCP server advertises toolName.
+func (g *GitHubMCPClient) HasTool(ctx context.Context, toolName string) bool {
+	names, err := g.ToolNames(ctx)
+	if err != nil {
+		return false
+	}
+	_, ok := names[toolName]
+	return ok
+}
+
+func (g *GitHubMCPClient) resetToolNames() {
+	g.toolsMu.Lock()
+	g.toolNames = nil
+	g.toolsMu.Unlock()
+}
+
+// CallToolBatch runs independent tool calls and returns their results in the
+// same order as calls. When the server advertises batch_execute the calls go
+// out as one request; otherwise they run concurrently over the MCP session.
+func (g *GitHubMCPClient) CallToolBatch(ctx context.Context, calls []ToolCallParams) []ToolCallResult {
+	if len(calls) > 1 && g.HasTool(ctx, batchExecuteTool) {
+		results, err := g.callBatchExecute(ctx, calls)
+		if err == nil {
+			return results
+		}
+		// Once the batch may have reached the server its writes may have run,
+		// so only re-run the calls one by one when that is known to be safe.
+		if !errors.Is(err, errRequestNotSent) && !allReadOnly(calls) {
+			g.logger.Warn("batch_execute failed after sending, not retrying its calls", "calls", len(calls), "error", err)
+			results = make([]ToolCallResult, len(calls))
+			for i, call := range calls {
+				results[i].Err = fmt.Errorf("%s via %s: %w", call.Name, batchExecuteTool, err)
+			}
+			return results
+		}
+		g.logger.Warn("batch_execute unusable, falling back to concurrent tool calls", "calls", len(calls), "reason", err)
+	}
+
+	results := make([]ToolCallResult, len(calls))
+
+	// Same cap the batch_execute path asks the server for.
+	sem := make(chan struct{}, batchMaxConcurrent)
+	var wg sync.WaitGroup
+	for i, call := range calls {
+		wg.Add(1)
+		go func(i int, call ToolCallParams) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			results[i].Result, results[i].Err = g.CallTool(ctx, call.Name, call.Arguments)
+		}(i, call)
+	}
+	wg.Wait()
+
+	return results
+}
+
+// callBatchExecute sends calls as a single batch_execute request in the
+// aggregator's format: the operations in order, a server-side concurrency
+// cap, and stopOnError off so one failure doesn't cancel the rest. The reply
+// carries one entry per operation, in order, with success, result and error.
+// Any other reply shape is reported as an error so the caller falls back.
+func (g *GitHubMCPClient) callBatchExecute(ctx context.Context, calls []ToolCallParams) ([]ToolCallResult, error) {
+	operations := make([]map[string]interface{}, len(calls))
+	for i, call := range calls {
+		operations[i] = map[string]interface{}{
+			"tool": call.Name,
+			"args": call.Arguments,
+		}
+		// The batch reaches GitHub as separate writes, so each one still
+		// takes a write slot.
+		if _, ok := contentCreatingTools[call.Name]; ok {
+			if err := g.waitForWriteSlot(ctx); err != nil {
+				return nil, err
+			}
+		}
+	}
+
+	// Sent once, without CallTool's reconnect-and-retry, so a batch that may
+	// already have run is never submitted a second time.
+	result, err := g.callToolOnce(ctx, batchExecuteTool, map[string]interface{}{
+		"operations":    operations,
+		"maxConcurrent": batchMaxConcurrent,
+		"stopOnError":   false,
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	var batchResponse struct {
+		Results []struct {
+			Success *bool           `json:"success"`
+			Result  json.RawMessage `json:"result"`
+			Error   string          `json:"error"`
+		} `json:"results"`
+	}
+	if err := decodeToolText(result, &batchResponse); err != nil {
+		return nil, fmt.Errorf("unexpected batch_execute reply: %w", err)
+	}
+	if batchResponse.Results == nil {
+		return nil, fmt.Errorf("unexpected batch_execute reply: no results array")
+	}
+	if len(batchResponse.Results) != len(calls) {
+		return nil, fmt.Errorf("unexpected batch_execute reply: %d results for %d operations", len(batchResponse.Results), len(calls))
+	}
+
+	results := make([]ToolCallResult, len(calls))
+	for i, r := range batchResponse.Results {
+		if r.Success == nil {
+			return nil, fmt.Errorf("unexpected batch_execute reply: result %d has no success flag", i)
+		}
+		if !*r.Success {
+			msg := r.Error
+			if msg == "" {
+				msg = "operation failed"
+			}
+			results[i].Err = fmt.Errorf("%s: %w", calls[i].Name, &toolError{Message: msg})
+			continue
+		}
+
+		var opResult map[string]interface{}
+		if len(r.Result) > 0 {
+			if err := json.Unmarshal(r.Result, &opResult); err != nil {
+				return nil, fmt.Errorf("unexpected batch_execute reply: result %d is not an object: %w", i, err)
+			}
+		}
+		if opResult == nil {
+			opResult = map[string]interface{}{}
+		}
+		if err := toolResultError(opResult); err != nil {
+			results[i].Err = fmt.Errorf("%s: %w", calls[i].Name, err)
+			continue
+		}
+		results[i].Result = opResult
+	}
+
+	g.retrySecondaryLimited(ctx, calls, results)
+	return results, nil
+}
+
+// retrySecondaryLimited re-runs, one at a time and with backoff, the batch
+// operations GitHub refused with a secondary rate limit. A refused operation
+// never ran, so repeating it is safe.
+func (g *GitHubMCPClient) retrySecondaryLimited(ctx context.Context, calls []ToolCallParams, results []ToolCallResult) {
+	var limited []int
+	for i, r := range results {
+		if r.Err != nil && isSecondaryRateLimit(r.Err) {
+			limited = append(limited, i)
+		}
+	}
+	if len(limited) == 0 {
+		return
+	}
+
+	delay := secondaryRateBackoff(0)
+	g.logger.Warn("GitHub secondary rate limit hit in batch, retrying operations", "operations", len(limited), "delay", delay)
+	if err := sleepCtx(ctx, delay); err != nil {
+		return
+	}
+
+	for _, i := range limited {
+		result, err := g.callToolWithBackoff(ctx, calls[i].Name, calls[i].Arguments)
+		results[i] = ToolCallResult{Result: result, Err: err}
+	}
+}
+
+// readOnlyTools are tools that only read from GitHub, so calls to them can be
+// repeated safely.
+var readOnlyTools = map[string]struct{}{
+	"get_file_contents":   {},
+	"get_commit":          {},
+	"get_pull_request":    {},
+	"list_branches":       {},
+	"list_commits":        {},
+	"list_pull_requests":  {},
+	"list_tags":           {},
+	"search_code":         {},
+	"search_repositories": {},
+}
+
+func allReadOnly(calls []ToolCallParams) bool {
+	for _, call := range calls {
+		if _, ok := readOnlyTools[call.Name]; !ok {
+			return false
+		}
+	}
+	return true
+}
+
+// contentCreatingTools are the tools that write to GitHub. GitHub's secondary
+// rate limits punish bursts of these, so they are spaced out client-side.
+var contentCreatingTools = map[string]struct{}{
+	"create_branch":         {},
+	"push_files":            {},
+	"create_pull_request":   {},
+	"create_or_update_file": {},
+	"create_issue":          {},
+	"add_issue_comment":     {},
+}
+
+// waitForWriteSlot reserves the next free write slot and sleeps until it
+// arrives, keeping content-creating calls at least minWriteInterval apart.
+func (g *GitHubMCPClient) waitForWriteSlot(ctx context.Context) error {
+	g.writeMu.Lock()
+	now := time.Now()
+	slot := g.nextWriteAt
+	if slot.Before(now) {
+		slot = now
+	}
+	g.nextWriteAt = slot.Add(minWriteInterval)
+	g.writeMu.Unlock()
+
+	return sleepCtx(ctx, slot.Sub(now))
+}
+
+// sleepCtx waits for d or until ctx is done, whichever comes first.
+func sleepCtx(ctx context.Context, d time.Duration) error {
+	if d <= 0 {
+		return nil
+	}
+
+	timer := time.NewTimer(d)
+	defer timer.Stop()
+	select {
+	case <-timer.C:
+		return nil
+	case <-ctx.Done():
+		return ctx.Err()
+	}
+}
+
+// isSecondaryRateLimit reports whether err is GitHub's secondary rate limit,
+// which comes back as a 403 with quota still left, so handleRateLimit doesn't
+// catch it. GitHub words it as "You have exceeded a secondary rate limit" or,
+// in older replies, "You have triggered an abuse detection mechanism".
+func isSecondaryRateLimit(err error) bool {
+	msg := strings.ToLower(err.Error())
+	return strings.Contains(msg, "secondary rate limit") || strings.Contains(msg, "abuse detection mechanism")
+}
+
+const (
+	maxSecondaryRateRetries = 5
+	maxSecondaryRateBackoff = 60 * time.Second
+)
+
+// secondaryRateBackoff is the wait before retry n (from 0): exponential with
+// up to a second of jitter, capped at maxSecondaryRateBackoff.
+func secondaryRateBackoff(n int) time.Duration {
+	backoff := time.Duration(1<<n)*time.Second + time.Duration(rand.Int63n(int64(time.Second)))
+	if backoff > maxSecondaryRateBackoff {
+		return maxSecondaryRateBackoff
+	}
+	return backoff
+}
+
+// callToolWithBackoff retries calls refused by GitHub's secondary rate limit
+// after a growing delay; any other outcome is returned on the first attempt.
+func (g *GitHubMCPClient) callToolWithBackoff(ctx context.Context, toolName string, args map[string]interface{}) (map[string]interface{}, error) {
+	for attempt := 0; ; attempt++ {
+		result, err := g.callToolOnce(ctx, toolName, args)
+		if err == nil || attempt >= maxSecondaryRateRetries || !isSecondaryRateLimit(err) {
+			return result, err
+		}
+
+		delay := secondaryRateBackoff(attempt)
+		g.logger.Warn("GitHub secondary rate limit hit, backing off", "tool", toolName, "attempt", attempt+1, "delay", delay)
+		if err := sleepCtx(ctx, delay); err != nil {
+			return nil, err
+		}
+	}
+}
+
 func (g *GitHubMCPClient) callToolOnce(ctx context.Context, toolName string, args map[string]interface{}) (map[string]interface{}, error) {
+	if _, ok := contentCreatingTools[toolName]; ok {
+		if err := g.waitForWriteSlot(ctx); err != nil {
+			return nil, err
+		}
+	}
+
 	request := MCPRequest{
 		JSONRPC: jsonRPCVersion,
 		Method:  "tools/call",
@@ -519,33 +932,115 @@ func (g *GitHubMCPClient) callToolOnce(ctx context.Context, toolName string, arg
 	}
 
 	if resp.Error != nil {
-		return nil, fmt.Errorf("MCP error %d: %s", resp.Error.Code, resp.Error.Message)
+		return nil, &mcpError{Code: resp.Error.Code, Message: resp.Error.Message}
 	}
 
-	if result, ok := resp.Result.(map[string]interface{}); ok {
-		return result, nil
+	var result map[string]interface{}
+	if err := decodeEnvelopeResult(resp, &result); err != nil {
+		return nil, fmt.Errorf("failed to decode MCP result: %w", err)
+	}
+	if result == nil {
+		result = map[string]interface{}{}
+	}
+	if err := toolResultError(result); err != nil {
+		return nil, err
 	}
 
-	if resp.Result == nil {
-		return map[string]interface{}{}, nil
+	return result, nil
+}
+
+// toolError is a tool call the server ran but reported as failed.
+type toolError struct {
+	Message string
+}
+
+func (e *toolError) Error() string {
+	return "tool error: " + e.Message
+}
+
+// toolResultError turns a result flagged with isError into an error carrying
+// its text content. Failures from GitHub itself, secondary rate limits
+// included, come back this way rather than as JSON-RPC errors.
+func toolResultError(result map[string]interface{}) error {
+	if isError, _ := result["isError"].(bool); !isError {
+		return nil
 	}
 
-	data, err := json.Marshal(resp.Result)
-	if err != nil {
-		return nil, fmt.Errorf("unexpected MCP result type %T", resp.Result)
+	var texts []string
+	content, _ := result["content"].([]interface{})
+	for _, item := range content {
+		if m, ok := item.(map[string]interface{}); ok {
+			if text, ok := m["text"].(string); ok && text != "" {
+				texts = append(texts, text)
+			}
+		}
+	}
+	if len(texts) == 0 {
+		return &toolError{Message: "tool reported an error"}
 	}
+	return &toolError{Message: strings.Join(texts, "\n")}
+}
 
-	var mapped map[string]interface{}
-	if err := json.Unmarshal(data, &mapped); err != nil {
-		return nil, fmt.Errorf("failed to decode MCP result: %w", err)
+// mcpError is a JSON-RPC error returned by the MCP server.
+type mcpError struct {
+	Code    int
+	Message string
+}
+
+func (e *mcpError) Error() string {
+	return fmt.Sprintf("MCP error %d: %s", e.Code, e.Message)
+}
+
+// errRateLimited marks failures caused by an exhausted GitHub rate limit.
+var errRateLimited = errors.New("GitHub API rate limit exceeded")
+
+// errRequestNotSent marks failures that happened before a request left the
+// client, so the server cannot have acted on it.
+var errRequestNotSent = errors.New("MCP request not sent")
+
+// notSentError keeps the underlying error's message while matching
+// errRequestNotSent.
+type notSentError struct{ err error }
+
+func (e *notSentError) Error() string   { return e.err.Error() }
+func (e *notSentError) Unwrap() []error { return []error{errRequestNotSent, e.err} }
+
+// errStreamClosed is returned to requests still waiting when the SSE stream
+// drops. The session is gone, so these calls are worth a reconnect.
+var errStreamClosed = errors.New("MCP SSE stream closed")
+
+// reconnectable reports whether a failed call is worth retrying on a fresh
+// connection. Errors the server actually answered with, rate limits and a
+// done context would fail the same way again, so they are returned as-is.
+func reconnectable(ctx context.Context, err error) bool {
+	if ctx.Err() != nil {
+		return false
 	}
+	var protoErr *mcpError
+	var toolErr *toolError
+	if errors.As(err, &protoErr) || errors.As(err, &toolErr) {
+		return false
+	}
+	return !errors.Is(err, errRateLimited) && !isSecondaryRateLimit(err)
+}
 
-	return mapped, nil
+// decodeEnvelopeResult decodes the raw result bytes straight into target.
+func decodeEnvelopeResult(resp mcpEnvelope, target interface{}) error {
+	if len(resp.Result) == 0 {
+		return nil
+	}
+	return json.Unmarshal(resp.Result, target)
 }
 
-func (g *GitHubMCPClient) reconnect() error {
+// reconnect replaces the session that was current as generation gen. When
+// several calls fail on the same session, the first one reconnects and the
+// rest find a newer generation and reuse it instead of tearing it down again.
+func (g *GitHubMCPClient) reconnect(gen uint64) error {
 	g.connectMu.Lock()
 	defer g.connectMu.Unlock()
+	if g.sessionGen.Load() != gen && g.messagesURL != "" {
+		return nil
+	}
 	return g.connectAndInitialize()
 }
 
@@ -565,10 +1060,17 @@ func (g *GitHubMCPClient) shutdownStream() {
 func (g *GitHubMCPClient) consumeSSE(body io.ReadCloser) {
 	reader := bufio.NewReader(body)
 	var eventName string
-	var dataLines []string
+	var line, data []byte
+	hasData := false
 
 	for {
-		line, err := reader.ReadString('\n')
+		// Drop oversized buffers instead of pinning them for the session.
+		if cap(line) > maxRetainedSSEBuffer {
+			line = nil
+		}
+
+		var err error
+		line, err = readSSELine(reader, line[:0])
 		if err != nil {
 			if err != io.EOF {
 				g.logger.Error("error reading SSE stream", "error", err)
@@ -576,37 +1078,56 @@ func (g *GitHubMCPClient) consumeSSE(body io.ReadCloser) {
 			break
 		}
 
-		line = strings.TrimRight(line, "\r\n")
-		if line == "" {
-			if len(dataLines) > 0 || eventName != "" {
-				data := strings.Join(dataLines, "\n")
+		line = bytes.TrimRight(line, "\r\n")
+		if len(line) == 0 {
+			if hasData || eventName != "" {
 				g.dispatchSSEEvent(eventName, data)
 			}
 			eventName = ""
-			dataLines = dataLines[:0]
+			data = data[:0]
+			hasData = false
+			if cap(data) > maxRetainedSSEBuffer {
+				data = nil
+			}
 			continue
 		}
 
-		if strings.HasPrefix(line, ":") {
+		if line[0] == ':' {
 			continue
 		}
 
-		if strings.HasPrefix(line, "event:") {
-			eventName = strings.TrimSpace(line[len("event:"):])
+		if bytes.HasPrefix(line, sseEventField) {
+			eventName = string(bytes.TrimSpace(line[len(sseEventField):]))
 			continue
 		}
 
-		if strings.HasPrefix(line, "data:") {
-			dataLines = append(dataLines, strings.TrimSpace(line[len("data:"):]))
+		if bytes.HasPrefix(line, sseDataField) {
+			if hasData {
+				data = append(data, '\n')
+			}
+			data = append(data, bytes.TrimSpace(line[len(sseDataField):])...)
+			hasData = true
 		}
 	}
 
 	body.Close()
-	g.failAllPending(fmt.Errorf("MCP SSE stream closed"))
+	g.failAllPending()
 	g.messagesURL = ""
 }
 
-func (g *GitHubMCPClient) dispatchSSEEvent(eventName, data string) {
+// readSSELine appends the next line from r to buf, growing past the reader's
+// internal buffer for large tool results without an extra string copy.
+func readSSELine(r *bufio.Reader, buf []byte) ([]byte, error) {
+	for {
+		chunk, err := r.ReadSlice('\n')
+		buf = append(buf, chunk...)
+		if err != bufio.ErrBufferFull {
+			return buf, err
+		}
+	}
+}
+
+func (g *GitHubMCPClient) dispatchSSEEvent(eventName string, data []byte) {
 	if eventName == "" {
 		eventName = "message"
 	}
@@ -615,7 +1136,7 @@ func (g *GitHubMCPClient) dispatchSSEEvent(eventName, data string) {
 	case "endpoint":
 		if g.endpointCh != nil {
 			select {
-			case g.endpointCh <- data:
+			case g.endpointCh <- string(data):
 			default:
 			}
 		}
@@ -626,15 +1147,18 @@ func (g *GitHubMCPClient) dispatchSSEEvent(eventName, data string) {
 	}
 }
 
-func (g *GitHubMCPClient) handleIncomingMessage(data string) {
+func (g *GitHubMCPClient) handleIncomingMessage(data []byte) {
 	var envelope mcpEnvelope
-	if err := json.Unmarshal([]byte(data), &envelope); err != nil {
+	if err := json.Unmarshal(data, &envelope); err != nil {
 		g.logger.Error("failed to decode MCP message", "error", err)
 		return
 	}
 
 	if envelope.ID == nil {
 		g.logger.Debug("received MCP notification", "method", envelope.Method)
+		if envelope.Method == "notifications/tools/list_changed" {
+			g.resetToolNames()
+		}
 		return
 	}
 
@@ -651,20 +1175,15 @@ func (g *GitHubMCPClient) handleIncomingMessage(data string) {
 	}
 }
 
-func (g *GitHubMCPClient) failAllPending(err error) {
+// failAllPending releases every in-flight caller by closing its channel. The
+// callers see errStreamClosed, a transport failure, rather than an envelope
+// that would look like an answer from the server.
+func (g *GitHubMCPClient) failAllPending() {
 	g.pendingMu.Lock()
 	defer g.pendingMu.Unlock()
 
 	for id, ch := range g.pending {
 		delete(g.pending, id)
-		idCopy := id
-		ch <- mcpEnvelope{
-			ID: &idCopy,
-			Error: &MCPError{
-				Code:    -1,
-				Message: err.Error(),
-			},
-		}
 		close(ch)
 	}
 }
@@ -686,11 +1205,11 @@ func (g *GitHubMCPClient) handleRateLimit(resp *http.Response) error {
 	if !resetAt.IsZero() {
 		formatted := resetAt.UTC().Format(time.RFC3339)
 		g.logger.Warn("GitHub API rate limit exhausted", "resets_at", formatted)
-		return fmt.Errorf("GitHub API rate limit exceeded; try again after %s", formatted)
+		return fmt.Errorf("%w; try again after %s", errRateLimited, formatted)
 	}
 
 	g.logger.Warn("GitHub API rate limit exhausted", "resets_at", "unknown")
-	return fmt.Errorf("GitHub API rate limit exceeded; try again later")
+	return fmt.Errorf("%w; try again later", errRateLimited)
 }
 
 func parseRateLimitReset(header string) time.Time {
@@ -711,11 +1230,15 @@ func parseRateLimitReset(header string) time.Time {
 
 func (g *GitHubMCPClient) getAccessToken() (string, error) {
 	if g.token != "" {
+		g.tokenMu.Lock()
 		g.logAuthMode("personal_access_token")
+		g.tokenMu.Unlock()
 		return g.token, nil
 	}
 
 	if g.hasGitHubAppCredentials() {
+		g.tokenMu.Lock()
+		defer g.tokenMu.Unlock()
 		g.logAuthMode("github_app_installation")
 		return g.getCachedOrGenerateToken()
 	}
@@ -737,7 +1260,8 @@ func (g *GitHubMCPClient) hasGitHubAppCredentials() bool {
 }
 
 func (g *GitHubMCPClient) getCachedOrGenerateToken() (string, error) {
-	if g.cachedToken != "" && time.Now().Before(g.tokenExpiry.Add(-tokenRefreshBuffer)) {
+	now := time.Now()
+	if g.cachedToken != "" && now.Before(g.tokenExpiry.Add(-tokenRefreshBuffer)) {
 		return g.cachedToken, nil
 	}
 
@@ -747,7 +1271,7 @@ func (g *GitHubMCPClient) getCachedOrGenerateToken() (string, error) {
 	}
 
 	g.cachedToken = token
-	g.tokenExpiry = time.Now().Add(tokenCacheDuration)
+	g.tokenExpiry = now.Add(tokenCacheDuration)
 
 	return token, nil
 }
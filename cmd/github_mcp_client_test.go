@@ -0,0 +1,58 @@
+package main
+
+import (
+	"errors"
+	"testing"
+)
+
+func TestToolResultErrorSecondaryRateLimit(t *testing.T) {
+	result := map[string]interface{}{
+		"isError": true,
+		"content": []interface{}{
+			map[string]interface{}{
+				"type": "text",
+				"text": "failed to create branch: POST https://api.github.com/repos/o/r/git/refs: 403 You have exceeded a secondary rate limit. Please wait a few minutes before you try again.",
+			},
+		},
+	}
+
+	err := toolResultError(result)
+	if err == nil {
+		t.Fatal("expected an error for an isError result")
+	}
+	if !isSecondaryRateLimit(err) {
+		t.Fatalf("expected a secondary rate limit, got %v", err)
+	}
+	var toolErr *toolError
+	if !errors.As(err, &toolErr) {
+		t.Fatalf("expected a *toolError, got %T", err)
+	}
+}
+
+func TestToolResultErrorSuccess(t *testing.T) {
+	result := map[string]interface{}{
+		"content": []interface{}{
+			map[string]interface{}{"type": "text", "text": "{}"},
+		},
+	}
+	if err := toolResultError(result); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+}
+
+func TestIsSecondaryRateLimit(t *testing.T) {
+	tests := []struct {
+		msg  string
+		want bool
+	}{
+		{"403 You have exceeded a secondary rate limit.", true},
+		{"403 You have triggered an abuse detection mechanism and have been temporarily blocked.", true},
+		{"issue body mentions abuse reporting", false},
+		{"404 Not Found", false},
+	}
+	for _, tt := range tests {
+		if got := isSecondaryRateLimit(errors.New(tt.msg)); got != tt.want {
+			t.Errorf("isSecondaryRateLimit(%q) = %v, want %v", tt.msg, got, tt.want)
+		}
+	}
+}
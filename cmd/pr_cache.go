@@ -0,0 +1,348 @@
+package main
+
+import (
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"errors"
+	"io"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+)
+
+const (
+	prCacheTTL        = 24 * time.Hour
+	prCacheMaxEntries = 512
+	prCacheFileName   = "pr-cache.json"
+)
+
+// prCacheEntry remembers a pull request opened for a given set of file
+// changes, so repeated release webhooks don't open the same PR again.
+type prCacheEntry struct {
+	prURL     string
+	commitURL string
+	created   time.Time
+}
+
+// prCacheKey identifies an update by its target repo and a digest of the
+// exact file contents being committed. It is a comparable struct so it is
+// used as a map key directly, without hex-encoding the digest.
+type prCacheKey struct {
+	owner  string
+	repo   string
+	digest [sha256.Size]byte
+}
+
+// prCacheRecord is the on-disk form of one cache entry.
+type prCacheRecord struct {
+	Owner     string    `json:"owner"`
+	Repo      string    `json:"repo"`
+	Digest    string    `json:"digest"`
+	PRURL     string    `json:"pr_url"`
+	CommitURL string    `json:"commit_url"`
+	Created   time.Time `json:"created"`
+}
+
+func newPRCacheKey(owner, repo string, files []fileCommitData) prCacheKey {
+	hash := sha256.New()
+	for _, f := range files {
+		io.WriteString(hash, f.path)
+		hash.Write([]byte{0})
+		io.WriteString(hash, f.newYAML)
+		hash.Write([]byte{0})
+	}
+
+	key := prCacheKey{owner: owner, repo: repo}
+	hash.Sum(key.digest[:0])
+	return key
+}
+
+// defaultPRCachePath places the cache under the user cache dir so it
+// survives restarts. An empty path keeps the cache in memory only.
+func defaultPRCachePath() string {
+	dir, err := os.UserCacheDir()
+	if err != nil || dir == "" {
+		return ""
+	}
+	return filepath.Join(dir, "ponos", prCacheFileName)
+}
+
+func (h *GitHubDeployHandler) cachedPR(key prCacheKey) (prCacheEntry, bool) {
+	h.prCacheMu.Lock()
+	defer h.prCacheMu.Unlock()
+
+	entry, ok := h.prCache[key]
+	if !ok || time.Since(entry.created) > prCacheTTL {
+		// Another ponos process sharing the cache file may have opened it.
+		unlock := h.lockPRCacheFile()
+		h.loadPRCacheLocked()
+		unlock()
+		entry, ok = h.prCache[key]
+	}
+	if !ok || time.Since(entry.created) > prCacheTTL {
+		return prCacheEntry{}, false
+	}
+	return entry, true
+}
+
+func (h *GitHubDeployHandler) storePR(key prCacheKey, entry prCacheEntry) {
+	h.prCacheMu.Lock()
+	defer h.prCacheMu.Unlock()
+
+	// Hold the file lock across the read-merge-write so concurrent processes
+	// don't overwrite each other's entries.
+	unlock := h.lockPRCacheFile()
+	defer unlock()
+
+	h.loadPRCacheLocked()
+	if h.prCache == nil {
+		h.prCache = make(map[prCacheKey]prCacheEntry)
+	}
+	h.evictPRCacheLocked(prCacheMaxEntries - 1)
+	h.prCache[key] = entry
+	h.savePRCacheLocked()
+}
+
+func (h *GitHubDeployHandler) loadPRCache() {
+	h.prCacheMu.Lock()
+	defer h.prCacheMu.Unlock()
+
+	unlock := h.lockPRCacheFile()
+	defer unlock()
+	h.loadPRCacheLocked()
+}
+
+// lockPRCacheFile takes the advisory lock guarding the cache file and returns
+// its release func. Failing to lock is logged and only loses cross-process
+// safety, so the cache keeps working.
+func (h *GitHubDeployHandler) lockPRCacheFile() func() {
+	if h.prCachePath == "" {
+		return func() {}
+	}
+	unlock, err := lockFile(h.prCachePath + ".lock")
+	if err != nil {
+		h.logger.Warn("Failed to lock PR cache", "path", h.prCachePath, "error", err)
+		return func() {}
+	}
+	return unlock
+}
+
+// loadPRCacheLocked merges unexpired entries from the cache file into memory,
+// keeping the newer entry when both sides know a key. Expired entries are
+// dropped on either side, so a stale local entry never hides a fresh one.
+func (h *GitHubDeployHandler) loadPRCacheLocked() {
+	if h.prCachePath == "" {
+		return
+	}
+
+	data, err := os.ReadFile(h.prCachePath)
+	if err != nil {
+		if !errors.Is(err, fs.ErrNotExist) {
+			h.logger.Warn("Failed to read PR cache", "path", h.prCachePath, "error", err)
+		}
+		return
+	}
+
+	var records []prCacheRecord
+	if err := json.Unmarshal(data, &records); err != nil {
+		h.logger.Warn("Ignoring unreadable PR cache", "path", h.prCachePath, "error", err)
+		return
+	}
+
+	if h.prCache == nil {
+		h.prCache = make(map[prCacheKey]prCacheEntry, len(records))
+	}
+	for k, e := range h.prCache {
+		if time.Since(e.created) > prCacheTTL {
+			delete(h.prCache, k)
+		}
+	}
+	for _, r := range records {
+		if time.Since(r.Created) > prCacheTTL {
+			continue
+		}
+		key := prCacheKey{owner: r.Owner, repo: r.Repo}
+		if n, err := hex.Decode(key.digest[:], []byte(r.Digest)); err != nil || n != sha256.Size {
+			continue
+		}
+		if existing, ok := h.prCache[key]; ok && !existing.created.Before(r.Created) {
+			continue
+		}
+		h.prCache[key] = prCacheEntry{prURL: r.PRURL, commitURL: r.CommitURL, created: r.Created}
+	}
+	h.evictPRCacheLocked(prCacheMaxEntries)
+}
+
+// savePRCacheLocked writes the unexpired entries to a temp file and renames
+// it over the cache file, so readers never see a partial write.
+func (h *GitHubDeployHandler) savePRCacheLocked() {
+	if h.prCachePath == "" {
+		return
+	}
+
+	records := make([]prCacheRecord, 0, len(h.prCache))
+	for k, e := range h.prCache {
+		if time.Since(e.created) > prCacheTTL {
+			continue
+		}
+		records = append(records, prCacheRecord{
+			Owner:     k.owner,
+			Repo:      k.repo,
+			Digest:    hex.EncodeToString(k.digest[:]),
+			PRURL:     e.prURL,
+			CommitURL: e.commitURL,
+			Created:   e.created,
+		})
+	}
+
+	if err := writePRCacheFile(h.prCachePath, records); err != nil {
+		h.logger.Warn("Failed to persist PR cache", "path", h.prCachePath, "error", err)
+	}
+}
+
+func writePRCacheFile(path string, records []prCacheRecord) error {
+	data, err := json.Marshal(records)
+	if err != nil {
+		return err
+	}
+
+	dir := filepath.Dir(path)
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		return err
+	}
+
+	tmpFile, err := os.CreateTemp(dir, prCacheFileName+".*")
+	if err != nil {
+		return err
+	}
+	tmpName := tmpFile.Name()
+	defer os.Remove(tmpName)
+
+	if _, err := tmpFile.Write(data); err != nil {
+		tmpFile.Close()
+		return err
+	}
+	if err := tmpFile.Close(); err != nil {
+		return err
+	}
+	return os.Rename(tmpName, path)
+}
+
+// evictPRCacheLocked drops the oldest entries until at most limit remain.
+func (h *GitHubDeployHandler) evictPRCacheLocked(limit int) {
+	for len(h.prCache) > limit {
+		var oldestKey prCacheKey
+		var oldest time.Time
+		for k, e := range h.prCache {
+			if oldest.IsZero() || e.created.Before(oldest) {
+				oldestKey, oldest = k, e.created
+			}
+		}
+		delete(h.prCache, oldestKey)
+	}
+}
+
+// updateCall is an updateNetworkImages run in progress. Identical requests
+// wait for it instead of repeating the work.
+type updateCall struct {
+	done   chan struct{}
+	result *NetworkUpdateResult
+	err    error
+}
+
+// updateEntry remembers a finished update, so an identical request can be
+// answered before any file is fetched.
+type updateEntry struct {
+	result  NetworkUpdateResult
+	created time.Time
+}
+
+// newUpdateKey identifies an update by what is known before fetching: the
+// release tag and the files it targets.
+func newUpdateKey(releaseTag string, files []fileInfo) string {
+	var b strings.Builder
+	b.WriteString(releaseTag)
+	for _, f := range files {
+		b.WriteByte(0)
+		b.WriteString(f.owner)
+		b.WriteByte('/')
+		b.WriteString(f.repo)
+		b.WriteByte('/')
+		b.WriteString(f.path)
+	}
+	return b.String()
+}
+
+// coalesceUpdate runs run once per key at a time; callers arriving while it
+// runs get its result. With remember set, a successful result is also kept
+// for prCacheTTL. Updates without a pinned release tag resolve the latest
+// tags, so those are only coalesced, not remembered.
+func (h *GitHubDeployHandler) coalesceUpdate(ctx context.Context, key string, remember bool, run func() (*NetworkUpdateResult, error)) (*NetworkUpdateResult, error) {
+	h.updatesMu.Lock()
+	if entry, ok := h.updatesDone[key]; ok {
+		if time.Since(entry.created) <= prCacheTTL {
+			h.updatesMu.Unlock()
+			h.logger.Info("Identical update already has a pull request, skipping", "pr_url", entry.result.PRUrl)
+			result := entry.result
+			return &result, nil
+		}
+		delete(h.updatesDone, key)
+	}
+	if call, ok := h.updates[key]; ok {
+		h.updatesMu.Unlock()
+		h.logger.Info("Identical update already in progress, waiting for it")
+		select {
+		case <-call.done:
+		case <-ctx.Done():
+			return &NetworkUpdateResult{}, ctx.Err()
+		}
+		result := *call.result
+		return &result, call.err
+	}
+	if h.updates == nil {
+		h.updates = make(map[string]*updateCall)
+	}
+	call := &updateCall{done: make(chan struct{}), result: &NetworkUpdateResult{}}
+	h.updates[key] = call
+	h.updatesMu.Unlock()
+
+	defer func() {
+		h.updatesMu.Lock()
+		delete(h.updates, key)
+		if remember && call.err == nil && call.result.PRUrl != "" {
+			if h.updatesDone == nil {
+				h.updatesDone = make(map[string]updateEntry)
+			}
+			h.evictUpdatesLocked(prCacheMaxEntries - 1)
+			h.updatesDone[key] = updateEntry{result: *call.result, created: time.Now()}
+		}
+		h.updatesMu.Unlock()
+		close(call.done)
+	}()
+
+	result, err := run()
+	if result != nil {
+		call.result = result
+	}
+	call.err = err
+	return call.result, call.err
+}
+
+// evictUpdatesLocked drops the oldest remembered updates until at most limit
+// remain.
+func (h *GitHubDeployHandler) evictUpdatesLocked(limit int) {
+	for len(h.updatesDone) > limit {
+		var oldestKey string
+		var oldest time.Time
+		for k, e := range h.updatesDone {
+			if oldest.IsZero() || e.created.Before(oldest) {
+				oldestKey, oldest = k, e.created
+			}
+		}
+		delete(h.updatesDone, oldestKey)
+	}
+}
@@ -0,0 +1,9 @@
+//go:build !unix
+
+package main
+
+// lockFile is a no-op where flock isn't available; the PR cache then only
+// guards against concurrent use within one process.
+func lockFile(path string) (func(), error) {
+	return func() {}, nil
+}
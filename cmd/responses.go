@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"regexp"
 	"strings"
+	"unicode/utf8"
 
 	"github.com/slack-go/slack"
 )
@@ -34,37 +35,34 @@ func buildReleaseNotificationBlocks(payload ReleasesWebhookPayload, summary *Age
 	}
 
 	var messageText strings.Builder
-	messageText.WriteString(fmt.Sprintf("%s *Ponos Release Alert*\n\n", icon))
+	fmt.Fprintf(&messageText, "%s *Ponos Release Alert*\n\n", icon)
 
-	messageText.WriteString(fmt.Sprintf("*Repository:* %s/%s\n", repo.Owner, repo.Name))
-	messageText.WriteString(fmt.Sprintf("*Network:* %s\n", repo.NetworkName))
-	messageText.WriteString(fmt.Sprintf("*Client:* %s\n", repo.ClientType))
-	messageText.WriteString(fmt.Sprintf("*Tag:* %s\n", release.TagName))
+	fmt.Fprintf(&messageText, "*Repository:* %s/%s\n", repo.Owner, repo.Name)
+	fmt.Fprintf(&messageText, "*Network:* %s\n", repo.NetworkName)
+	fmt.Fprintf(&messageText, "*Client:* %s\n", repo.ClientType)
+	fmt.Fprintf(&messageText, "*Tag:* %s\n", release.TagName)
 	if repo.DockerTag != "" && !strings.EqualFold(repo.DockerTag, release.TagName) {
-		messageText.WriteString(fmt.Sprintf("*Docker Tag:* %s\n", repo.DockerTag))
+		fmt.Fprintf(&messageText, "*Docker Tag:* %s\n", repo.DockerTag)
 	}
-	messageText.WriteString(fmt.Sprintf("*Published:* %s\n\n", release.PublishedAt))
+	fmt.Fprintf(&messageText, "*Published:* %s\n\n", release.PublishedAt)
 
 	releaseSummary := strings.TrimSpace(summary.ReleaseSummary)
 	if releaseSummary == "" || strings.EqualFold(releaseSummary, "Not specified") {
 		if release.Body != "" {
-			bodyPreview := release.Body
-			if len(bodyPreview) > 600 {
-				bodyPreview = bodyPreview[:600] + "\n\n…"
-			}
+			bodyPreview := truncateText(release.Body, 600, "\n\n…")
 			releaseSummary = fmt.Sprintf("Summary derived from GitHub release notes:\n%s", bodyPreview)
 		} else {
 			releaseSummary = "Upgrade generated without additional release analysis details."
 		}
 	}
 
-	messageText.WriteString(fmt.Sprintf(":memo: *Nodeoperator Agent Generated Release Summary*\n%s\n\n", releaseSummary))
+	fmt.Fprintf(&messageText, ":memo: *Nodeoperator Agent Generated Release Summary*\n%s\n\n", releaseSummary)
 
 	messageText.WriteString(":gear: *Next Steps*\n")
 	messageText.WriteString("- PR created and hands off to Authorized reviewer for Approval and Merge\n")
 
 	if summary.ConfigChangesNeeded != "" && summary.ConfigChangesNeeded != "Not specified" {
-		messageText.WriteString(fmt.Sprintf("- Config changes: %s\n", summary.ConfigChangesNeeded))
+		fmt.Fprintf(&messageText, "- Config changes: %s\n", summary.ConfigChangesNeeded)
 	} else {
 		messageText.WriteString("- No config changes noted.\n")
 	}
@@ -75,11 +73,11 @@ func buildReleaseNotificationBlocks(payload ReleasesWebhookPayload, summary *Age
 	}
 	messageText.WriteString("\n")
 
-	messageText.WriteString(fmt.Sprintf(":warning: *Risk*\n- %s: %s\n\n",
-		strings.Title(summary.Severity), summary.RiskAssessment))
+	fmt.Fprintf(&messageText, ":warning: *Risk*\n- %s: %s\n\n",
+		strings.Title(summary.Severity), summary.RiskAssessment)
 
 	if len(prURL) > 0 && prURL[0] != "" {
-		messageText.WriteString(fmt.Sprintf(":link: *Pull Request:* <%s|View PR>", prURL[0]))
+		fmt.Fprintf(&messageText, ":link: *Pull Request:* <%s|View PR>", prURL[0])
 	}
 
 	return []slack.Block{
@@ -90,14 +88,31 @@ func buildReleaseNotificationBlocks(payload ReleasesWebhookPayload, summary *Age
 	}
 }
 
+// truncateText cuts s so that it plus suffix fits in limit bytes, which also
+// bounds it to limit characters. The cut is moved back to a rune boundary so
+// multi-byte characters are never split.
+func truncateText(s string, limit int, suffix string) string {
+	if len(s) <= limit {
+		return s
+	}
+	cut := max(limit-len(suffix), 0)
+	for cut > 0 && !utf8.RuneStart(s[cut]) {
+		cut--
+	}
+	return s[:cut] + suffix
+}
+
+var (
+	quotedVersionTagRe = regexp.MustCompile(`"(v?\d+\.\d+\.\d+[^"]*)"`)
+	bareVersionTagRe   = regexp.MustCompile(`\b(v?\d+\.\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9\-\.]+)?)\b`)
+)
+
 func extractVersionTag(aiResponse string) string {
-	re := regexp.MustCompile(`"(v?\d+\.\d+\.\d+[^"]*)"`)
-	if matches := re.FindStringSubmatch(aiResponse); len(matches) > 1 {
+	if matches := quotedVersionTagRe.FindStringSubmatch(aiResponse); len(matches) > 1 {
 		return matches[1]
 	}
 
-	re = regexp.MustCompile(`\b(v?\d+\.\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9\-\.]+)?)\b`)
-	if matches := re.FindStringSubmatch(aiResponse); len(matches) > 1 {
+	if matches := bareVersionTagRe.FindStringSubmatch(aiResponse); len(matches) > 1 {
 		return matches[1]
 	}
 
@@ -115,28 +130,52 @@ func formatStructuredConfigChanges(instructions []ConfigChangeInstruction) strin
 			continue
 		}
 
-		var parts []string
-		if instr.Description != "" {
-			parts = append(parts, instr.Description)
-		} else if instr.Action != "" {
-			parts = append(parts, strings.Title(instr.Action))
-		}
-		if instr.Path != "" {
-			parts = append(parts, fmt.Sprintf("`%s`", instr.Path))
-		}
-
-		if len(parts) == 0 {
-			continue
+		lead := instr.Description
+		if lead == "" && instr.Action != "" {
+			lead = strings.Title(instr.Action)
 		}
 
 		builder.WriteString("• ")
-		builder.WriteString(strings.Join(parts, " — "))
+		builder.WriteString(lead)
+		if instr.Path != "" {
+			if lead != "" {
+				builder.WriteString(" — ")
+			}
+			builder.WriteString("`")
+			builder.WriteString(instr.Path)
+			builder.WriteString("`")
+		}
 		builder.WriteString("\n")
 	}
 
 	return strings.TrimSpace(builder.String())
 }
 
+// prBodyTemplate is the pull request body for automated upgrades. Its verbs
+// are, in order: bot name, release summary, config changes, risk assessment,
+// severity, optional structured changes section, bot name, bot name.
+const prBodyTemplate = `## 🤖 Automated Update by %s
+
+**NodeOperator AI Analysis:**
+%s
+
+**Configuration Changes:**
+%s
+
+**Risk Assessment:**
+%s
+
+**Severity:** %s
+%s
+
+---
+**About this PR:**
+- 🤖 **Created by:** %s Bot
+- 🔍 **Node Operator Agent Analysis:** Comprehensive release analysis performed
+- ⚡ **Action Required:** Review and decide whether to merge or close
+
+*This PR was automatically created by %s. The AI has analyzed the release and provided recommendations above.*`
+
 func buildPRContent(networkName, releaseTag, botName string, summary *AgentSummary, release *ReleaseInfo) (title, body, commitMessage string) {
 	if botName == "" {
 		botName = "Ponos"
@@ -156,10 +195,7 @@ func buildPRContent(networkName, releaseTag, botName string, summary *AgentSumma
 	releaseSummary := strings.TrimSpace(summary.ReleaseSummary)
 	if releaseSummary == "" || strings.EqualFold(releaseSummary, "Not specified") {
 		if release != nil && release.Body != "" {
-			bodyPreview := release.Body
-			if len(bodyPreview) > 1000 {
-				bodyPreview = bodyPreview[:1000] + "\n\n…"
-			}
+			bodyPreview := truncateText(release.Body, 1000, "\n\n…")
 			releaseSummary = fmt.Sprintf("Summary derived from GitHub release notes:\n%s", bodyPreview)
 		} else {
 			releaseSummary = fmt.Sprintf("Upgrade %s to %s based on latest release information.", networkName, cleanReleaseTag)
@@ -194,38 +230,18 @@ func buildPRContent(networkName, releaseTag, botName string, summary *AgentSumma
 		severity = "info"
 	}
 
-	body = fmt.Sprintf(`## 🤖 Automated Update by %s
-
-**NodeOperator AI Analysis:**
-%s
-
-**Configuration Changes:**
-%s
-
-**Risk Assessment:**
-%s
-
-**Severity:** %s
-%s
-
----
-**About this PR:**
-- 🤖 **Created by:** %s Bot
-- 🔍 **Node Operator Agent Analysis:** Comprehensive release analysis performed
-- ⚡ **Action Required:** Review and decide whether to merge or close
+	var structuredSection string
+	if structured != "" && structured != configChanges {
+		structuredSection = "\n**Structured Config Changes:**\n" + structured + "\n"
+	}
 
-*This PR was automatically created by %s. The AI has analyzed the release and provided recommendations above.*`,
+	body = fmt.Sprintf(prBodyTemplate,
 		botName,
 		releaseSummary,
 		configChanges,
 		riskAssessment,
 		strings.ToUpper(severity),
-		func() string {
-			if structured == "" || structured == configChanges {
-				return ""
-			}
-			return fmt.Sprintf("\n**Structured Config Changes:**\n%s\n", structured)
-		}(),
+		structuredSection,
 		botName,
 		botName)
 
@@ -61,6 +61,30 @@ var (
 	activityStyle = lipgloss.NewStyle().
 			Foreground(subtleColor).
 			Italic(true)
+
+	toolHeaderStyle = lipgloss.NewStyle().
+			Foreground(brandColor)
+
+	todoPendingStyle = lipgloss.NewStyle().
+				Foreground(subtleColor)
+
+	todoInProgressStyle = lipgloss.NewStyle().
+				Foreground(accentColor)
+
+	todoCompletedStyle = lipgloss.NewStyle().
+				Foreground(successColor)
+
+	helperSelectedStyle = helpStyle.
+				Foreground(accentColor).
+				Bold(true)
+
+	helperPanelStyle = lipgloss.NewStyle().
+				Border(lipgloss.RoundedBorder()).
+				BorderForeground(subtleColor).
+				Padding(0, 1)
+
+	// spinnerFrames are the frames of the streaming activity indicator.
+	spinnerFrames = []string{"|", "/", "-", "\\"}
 )
 
 const (
@@ -130,12 +154,30 @@ var helperCommands = []HelperCommand{
 	{Command: "diagnose <network>", Description: "Run diagnostics for a network"},
 }
 
+// helperSearchKeys holds the lowercased command and description for each
+// entry in helperCommands, so filtering on every keystroke doesn't redo it.
+var helperSearchKeys = func() []struct{ command, description string } {
+	keys := make([]struct{ command, description string }, len(helperCommands))
+	for i, helper := range helperCommands {
+		keys[i].command = strings.ToLower(helper.Command)
+		keys[i].description = strings.ToLower(helper.Description)
+	}
+	return keys
+}()
+
 type ChatMessage struct {
 	ID        string
 	Role      string
 	Content   string
 	Timestamp time.Time
 	Actions   []string
+
+	// rendered caches the styled output for the Role, Content and width it
+	// was produced from, so unchanged messages aren't re-wrapped every frame.
+	rendered        string
+	renderedRole    string
+	renderedContent string
+	renderedWidth   int
 }
 
 type msgResponse struct {
@@ -542,19 +584,7 @@ func (m *tuiModel) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 				m.currentTodos = msg.update.Todos
 				m.showTodos = true
 
-				var activityMsg string
-				switch msg.update.ToolName {
-				case "create_todo":
-					activityMsg = "Created new task"
-				case "create_deployment_todos":
-					activityMsg = fmt.Sprintf("Created deployment plan (%d tasks)", len(msg.update.Todos))
-				case "update_todo":
-					activityMsg = "Updated task status"
-				case "list_todos":
-					activityMsg = fmt.Sprintf("Showing %d active tasks", len(msg.update.Todos))
-				default:
-					activityMsg = "Updated tasks"
-				}
+				activityMsg := todoActivityMessage(msg.update.ToolName, len(msg.update.Todos))
 
 				m.messages = append(m.messages, ChatMessage{
 					ID:        generateMessageID(),
@@ -727,8 +757,7 @@ func (m *tuiModel) View() string {
 }
 
 func (m *tuiModel) getAnimatedIndicator() string {
-	frames := []string{"|", "/", "-", "\\"}
-	return frames[m.animationFrame%len(frames)]
+	return spinnerFrames[m.animationFrame%len(spinnerFrames)]
 }
 
 func (m *tuiModel) updateViewportContent() {
@@ -744,60 +773,16 @@ func (m *tuiModel) updateViewportContent() {
 		return
 	}
 
-	for _, msg := range m.messages {
-		var prefix, text string
-		var style lipgloss.Style
-
-		switch msg.Role {
-		case "user":
-			prefix = "-> "
-			text = msg.Content
-			style = userMessageStyle
-		case "assistant":
-			prefix = ""
-			text = msg.Content
-			style = assistantMessageStyle
-		case "thinking":
-			prefix = "> "
-			text = msg.Content
-			style = systemMessageStyle
-		case "system":
-			prefix = ""
-			text = msg.Content
-			style = systemMessageStyle
-		case "error":
-			prefix = "Error: "
-			text = msg.Content
-			style = errorMessageStyle
-		case "tool_header":
-			prefix = ""
-			text = getToolContextualMessage(msg.Content)
-			style = lipgloss.NewStyle().Foreground(brandColor).Bold(false)
-		case "tool_result":
-			parts := strings.Split(msg.Content, "|")
-			toolName := parts[0]
-			success := len(parts) > 1 && parts[1] == "true"
-			friendlyName := getToolCompletionMessage(toolName, success)
-			if success {
-				prefix = "✓ "
-				text = friendlyName
-				style = lipgloss.NewStyle().Foreground(successColor)
-			} else {
-				prefix = "✗ "
-				text = friendlyName
-				style = lipgloss.NewStyle().Foreground(errorColor)
-			}
-		case "activity":
-			prefix = ""
-			text = msg.Content
-			style = activityStyle
+	for i := range m.messages {
+		msg := &m.messages[i]
+		if msg.rendered == "" || msg.renderedWidth != maxWidth || msg.renderedRole != msg.Role || msg.renderedContent != msg.Content {
+			msg.rendered = renderChatMessage(*msg, maxWidth)
+			msg.renderedRole = msg.Role
+			msg.renderedContent = msg.Content
+			msg.renderedWidth = maxWidth
 		}
 
-		// Wrap text to fit viewport width
-		fullText := prefix + text
-		wrappedText := wrapText(fullText, maxWidth)
-
-		content.WriteString(style.Render(wrappedText))
+		content.WriteString(msg.rendered)
 		content.WriteString("\n\n")
 	}
 
@@ -808,6 +793,62 @@ func (m *tuiModel) updateViewportContent() {
 	}
 }
 
+func renderChatMessage(msg ChatMessage, maxWidth int) string {
+	var prefix, text string
+	var style lipgloss.Style
+
+	switch msg.Role {
+	case "user":
+		prefix = "-> "
+		text = msg.Content
+		style = userMessageStyle
+	case "assistant":
+		prefix = ""
+		text = msg.Content
+		style = assistantMessageStyle
+	case "thinking":
+		prefix = "> "
+		text = msg.Content
+		style = systemMessageStyle
+	case "system":
+		prefix = ""
+		text = msg.Content
+		style = systemMessageStyle
+	case "error":
+		prefix = "Error: "
+		text = msg.Content
+		style = errorMessageStyle
+	case "tool_header":
+		prefix = ""
+		text = getToolContextualMessage(msg.Content)
+		style = toolHeaderStyle
+	case "tool_result":
+		parts := strings.Split(msg.Content, "|")
+		toolName := parts[0]
+		success := len(parts) > 1 && parts[1] == "true"
+		friendlyName := getToolCompletionMessage(toolName, success)
+		if success {
+			prefix = "✓ "
+			text = friendlyName
+			style = successMessageStyle
+		} else {
+			prefix = "✗ "
+			text = friendlyName
+			style = errorMessageStyle
+		}
+	case "activity":
+		prefix = ""
+		text = msg.Content
+		style = activityStyle
+	}
+
+	// Wrap text to fit viewport width
+	fullText := prefix + text
+	wrappedText := wrapText(fullText, maxWidth)
+
+	return style.Render(wrappedText)
+}
+
 func (tui *PonosAgentTUI) getHelpText() string {
 	return `Usage Modes
 • Interactive – run ponos-tui and start chatting
@@ -971,25 +1012,25 @@ func (m *tuiModel) renderTodoSection() string {
 
 	for i, todo := range m.currentTodos {
 		var status string
-		var color lipgloss.Color
+		var style lipgloss.Style
 
 		switch todo.Status {
 		case "pending":
 			status = "[ ]"
-			color = subtleColor
+			style = todoPendingStyle
 		case "in_progress":
 			status = "[~]"
-			color = accentColor
+			style = todoInProgressStyle
 		case "completed":
 			status = "[x]"
-			color = successColor
+			style = todoCompletedStyle
 		default:
 			status = "[?]"
-			color = subtleColor
+			style = todoPendingStyle
 		}
 
 		line := fmt.Sprintf("%d. %s %s", i+1, status, todo.Content)
-		styledLine := lipgloss.NewStyle().Foreground(color).Render(line)
+		styledLine := style.Render(line)
 		todoLines = append(todoLines, styledLine)
 	}
 
@@ -1018,19 +1059,7 @@ func (m *tuiModel) handleTodoUpdate(message string) error {
 		m.tui.logger.Info("Updated TODOs", "count", len(streamData.Todos), "tool", streamData.ToolName)
 
 		if streamData.ToolName != "" {
-			var activityMsg string
-			switch streamData.ToolName {
-			case "create_todo":
-				activityMsg = "Created new task"
-			case "create_deployment_todos":
-				activityMsg = fmt.Sprintf("Created deployment plan (%d tasks)", len(streamData.Todos))
-			case "update_todo":
-				activityMsg = "Updated task status"
-			case "list_todos":
-				activityMsg = fmt.Sprintf("Showing %d active tasks", len(streamData.Todos))
-			default:
-				activityMsg = "Updated tasks"
-			}
+			activityMsg := todoActivityMessage(streamData.ToolName, len(streamData.Todos))
 
 			m.messages = append(m.messages, ChatMessage{
 				ID:        generateMessageID(),
@@ -1044,6 +1073,26 @@ func (m *tuiModel) handleTodoUpdate(message string) error {
 	return nil
 }
 
+// todoActivityMessages maps todo tool names to the activity line shown in the
+// chat, given the number of todos in the update.
+var todoActivityMessages = map[string]func(count int) string{
+	"create_todo": func(int) string { return "Created new task" },
+	"create_deployment_todos": func(count int) string {
+		return fmt.Sprintf("Created deployment plan (%d tasks)", count)
+	},
+	"update_todo": func(int) string { return "Updated task status" },
+	"list_todos": func(count int) string {
+		return fmt.Sprintf("Showing %d active tasks", count)
+	},
+}
+
+func todoActivityMessage(toolName string, count int) string {
+	if format, ok := todoActivityMessages[toolName]; ok {
+		return format(count)
+	}
+	return "Updated tasks"
+}
+
 func (m *tuiModel) handleSimpleTodoMessage(message string) error {
 	if strings.Contains(message, "TODO") || strings.Contains(message, "task") {
 		m.messages = append(m.messages, ChatMessage{
@@ -1061,10 +1110,9 @@ func (m *tuiModel) updateHelperDropdown() {
 	if strings.HasPrefix(input, "/") {
 		query := strings.ToLower(strings.TrimPrefix(input, "/"))
 		var filtered []HelperCommand
-		for _, helper := range helperCommands {
-			cmd := strings.ToLower(helper.Command)
-			desc := strings.ToLower(helper.Description)
-			if query == "" || strings.Contains(cmd, query) || strings.Contains(desc, query) {
+		for i, helper := range helperCommands {
+			keys := helperSearchKeys[i]
+			if query == "" || strings.Contains(keys.command, query) || strings.Contains(keys.description, query) {
 				filtered = append(filtered, helper)
 			}
 		}
@@ -1136,7 +1184,7 @@ func (m *tuiModel) renderHelperDropdown() string {
 		style := helpStyle
 		if i == m.helperSelected {
 			indicator = "› "
-			style = helpStyle.Foreground(accentColor).Bold(true)
+			style = helperSelectedStyle
 		}
 		entry := fmt.Sprintf("%s%s – %s", indicator, helper.Command, helper.Description)
 		lines = append(lines, style.Render(entry))
@@ -1146,41 +1194,133 @@ func (m *tuiModel) renderHelperDropdown() string {
 	lines = append(lines, helpStyle.Render("Shortcuts: Enter send • Shift+Enter newline • Tab autocomplete • Ctrl+C exit"))
 
 	panel := strings.Join(lines, "\n")
-	return lipgloss.NewStyle().
-		Border(lipgloss.RoundedBorder()).
-		BorderForeground(subtleColor).
-		Padding(0, 1).
-		Render(panel)
+	return helperPanelStyle.Render(panel)
 }
 
-func getToolContextualMessage(toolName string) string {
-	contextMessages := map[string]string{
-		"upgrade_blockchain_client": "Starting the node upgrade process...",
-		"create_pull_request":       "Creating a pull request with the changes...",
-		"update_network_images":     "Updating container images across the network...",
-		"fetch_github_content":      "Fetching the latest configuration from GitHub...",
-		"update_deployment_files":   "Updating deployment configuration files...",
-		"run_network_diagnostics":   "Running diagnostics to check network health...",
-		"validate_configuration":    "Validating the configuration settings...",
-		"backup_current_state":      "Creating a backup of the current state...",
-		"rollback_changes":          "Rolling back to the previous configuration...",
-		"verify_upgrade_success":    "Verifying the upgrade completed successfully...",
-		"run_diagnostics":           "Running diagnostics to gather evidence...",
-		"slack_post_message":        "Sending an update to Slack...",
-		"telescope_node_status":     "Checking node health status...",
-		"telescope_sync_status":     "Checking sync status...",
-		"telescope_recent_errors":   "Collecting recent errors...",
-		"telescope_get_logs":        "Fetching component logs...",
-		"telescope_query_logs":      "Querying logs...",
-		"telescope_query_metrics":   "Querying metrics...",
-		"telescope_cpu_usage":       "Checking CPU usage...",
-		"telescope_memory_usage":    "Checking memory usage...",
-		"telescope_disk_usage":      "Checking disk usage...",
-		"telescope_network_usage":   "Checking network usage...",
-	}
+// toolMessages holds the status lines shown for a tool in the TUI.
+type toolMessages struct {
+	running string
+	success string
+	failure string
+}
+
+// toolMessageTable maps each tool name to its running, success and failure lines.
+var toolMessageTable = map[string]toolMessages{
+	"upgrade_blockchain_client": {
+		running: "Starting the node upgrade process...",
+		success: "Node upgrade completed successfully",
+		failure: "Node upgrade failed - please check the logs",
+	},
+	"create_pull_request": {
+		running: "Creating a pull request with the changes...",
+		success: "Pull request created successfully",
+		failure: "Failed to create pull request",
+	},
+	"update_network_images": {
+		running: "Updating container images across the network...",
+		success: "Container images updated across the network",
+		failure: "Failed to update container images",
+	},
+	"fetch_github_content": {
+		running: "Fetching the latest configuration from GitHub...",
+		success: "Configuration fetched from GitHub",
+		failure: "Failed to fetch configuration from GitHub",
+	},
+	"update_deployment_files": {
+		running: "Updating deployment configuration files...",
+		success: "Deployment configuration updated",
+		failure: "Failed to update deployment configuration",
+	},
+	"run_network_diagnostics": {
+		running: "Running diagnostics to check network health...",
+		success: "Network diagnostics completed - all systems healthy",
+		failure: "Network diagnostics failed - issues detected",
+	},
+	"validate_configuration": {
+		running: "Validating the configuration settings...",
+		success: "Configuration validation passed",
+		failure: "Configuration validation failed",
+	},
+	"backup_current_state": {
+		running: "Creating a backup of the current state...",
+		success: "Current state backed up successfully",
+		failure: "Failed to backup current state",
+	},
+	"rollback_changes": {
+		running: "Rolling back to the previous configuration...",
+		success: "Successfully rolled back to previous configuration",
+		failure: "Failed to rollback changes",
+	},
+	"verify_upgrade_success": {
+		running: "Verifying the upgrade completed successfully...",
+		success: "Upgrade verification completed successfully",
+		failure: "Upgrade verification failed",
+	},
+	"run_diagnostics": {
+		running: "Running diagnostics to gather evidence...",
+		success: "Diagnostics completed successfully",
+		failure: "Diagnostics failed",
+	},
+	"slack_post_message": {
+		running: "Sending an update to Slack...",
+		success: "Slack update sent",
+		failure: "Failed to send Slack update",
+	},
+	"telescope_node_status": {
+		running: "Checking node health status...",
+		success: "Node health retrieved",
+		failure: "Failed to retrieve node health",
+	},
+	"telescope_sync_status": {
+		running: "Checking sync status...",
+		success: "Sync status retrieved",
+		failure: "Failed to retrieve sync status",
+	},
+	"telescope_recent_errors": {
+		running: "Collecting recent errors...",
+		success: "Recent errors retrieved",
+		failure: "Failed to retrieve recent errors",
+	},
+	"telescope_get_logs": {
+		running: "Fetching component logs...",
+		success: "Logs retrieved",
+		failure: "Failed to retrieve logs",
+	},
+	"telescope_query_logs": {
+		running: "Querying logs...",
+		success: "Log query completed",
+		failure: "Log query failed",
+	},
+	"telescope_query_metrics": {
+		running: "Querying metrics...",
+		success: "Metric query completed",
+		failure: "Metric query failed",
+	},
+	"telescope_cpu_usage": {
+		running: "Checking CPU usage...",
+		success: "CPU usage retrieved",
+		failure: "Failed to retrieve CPU usage",
+	},
+	"telescope_memory_usage": {
+		running: "Checking memory usage...",
+		success: "Memory usage retrieved",
+		failure: "Failed to retrieve memory usage",
+	},
+	"telescope_disk_usage": {
+		running: "Checking disk usage...",
+		success: "Disk usage retrieved",
+		failure: "Failed to retrieve disk usage",
+	},
+	"telescope_network_usage": {
+		running: "Checking network usage...",
+		success: "Network usage retrieved",
+		failure: "Failed to retrieve network usage",
+	},
+}
 
-	if message, exists := contextMessages[toolName]; exists {
-		return message
+func getToolContextualMessage(toolName string) string {
+	if messages, exists := toolMessageTable[toolName]; exists {
+		return messages.running
 	}
 
 	// Fallback: create a contextual message from the tool name
@@ -1190,66 +1330,16 @@ func getToolContextualMessage(toolName string) string {
 
 func getToolCompletionMessage(toolName string, success bool) string {
 	if success {
-		successMessages := map[string]string{
-			"upgrade_blockchain_client": "Node upgrade completed successfully",
-			"create_pull_request":       "Pull request created successfully",
-			"update_network_images":     "Container images updated across the network",
-			"fetch_github_content":      "Configuration fetched from GitHub",
-			"update_deployment_files":   "Deployment configuration updated",
-			"run_network_diagnostics":   "Network diagnostics completed - all systems healthy",
-			"validate_configuration":    "Configuration validation passed",
-			"backup_current_state":      "Current state backed up successfully",
-			"rollback_changes":          "Successfully rolled back to previous configuration",
-			"verify_upgrade_success":    "Upgrade verification completed successfully",
-			"run_diagnostics":           "Diagnostics completed successfully",
-			"slack_post_message":        "Slack update sent",
-			"telescope_node_status":     "Node health retrieved",
-			"telescope_sync_status":     "Sync status retrieved",
-			"telescope_recent_errors":   "Recent errors retrieved",
-			"telescope_get_logs":        "Logs retrieved",
-			"telescope_query_logs":      "Log query completed",
-			"telescope_query_metrics":   "Metric query completed",
-			"telescope_cpu_usage":       "CPU usage retrieved",
-			"telescope_memory_usage":    "Memory usage retrieved",
-			"telescope_disk_usage":      "Disk usage retrieved",
-			"telescope_network_usage":   "Network usage retrieved",
-		}
-
-		if message, exists := successMessages[toolName]; exists {
-			return message
+		if messages, exists := toolMessageTable[toolName]; exists {
+			return messages.success
 		}
 
 		// Fallback
 		friendlyName := strings.ReplaceAll(toolName, "_", " ")
 		return fmt.Sprintf("%s completed successfully", strings.Title(friendlyName))
 	} else {
-		failureMessages := map[string]string{
-			"upgrade_blockchain_client": "Node upgrade failed - please check the logs",
-			"create_pull_request":       "Failed to create pull request",
-			"update_network_images":     "Failed to update container images",
-			"fetch_github_content":      "Failed to fetch configuration from GitHub",
-			"update_deployment_files":   "Failed to update deployment configuration",
-			"run_network_diagnostics":   "Network diagnostics failed - issues detected",
-			"validate_configuration":    "Configuration validation failed",
-			"backup_current_state":      "Failed to backup current state",
-			"rollback_changes":          "Failed to rollback changes",
-			"verify_upgrade_success":    "Upgrade verification failed",
-			"run_diagnostics":           "Diagnostics failed",
-			"slack_post_message":        "Failed to send Slack update",
-			"telescope_node_status":     "Failed to retrieve node health",
-			"telescope_sync_status":     "Failed to retrieve sync status",
-			"telescope_recent_errors":   "Failed to retrieve recent errors",
-			"telescope_get_logs":        "Failed to retrieve logs",
-			"telescope_query_logs":      "Log query failed",
-			"telescope_query_metrics":   "Metric query failed",
-			"telescope_cpu_usage":       "Failed to retrieve CPU usage",
-			"telescope_memory_usage":    "Failed to retrieve memory usage",
-			"telescope_disk_usage":      "Failed to retrieve disk usage",
-			"telescope_network_usage":   "Failed to retrieve network usage",
-		}
-
-		if message, exists := failureMessages[toolName]; exists {
-			return message
+		if messages, exists := toolMessageTable[toolName]; exists {
+			return messages.failure
 		}
 
 		// Fallback
@@ -1258,59 +1348,92 @@ func getToolCompletionMessage(toolName string, success bool) string {
 	}
 }
 
+// fitsWidth reports whether every line of text is at most width bytes, in
+// which case wrapping would return text unchanged.
+func fitsWidth(text string, width int) bool {
+	for {
+		i := strings.IndexByte(text, '\n')
+		if i < 0 {
+			return len(text) <= width
+		}
+		if i > width {
+			return false
+		}
+		text = text[i+1:]
+	}
+}
+
 func wrapText(text string, width int) string {
-	if width <= 0 {
+	if width <= 0 || fitsWidth(text, width) {
 		return text
 	}
 
 	var result strings.Builder
-	lines := strings.Split(text, "\n")
+	result.Grow(len(text) + len(text)/width + 1)
 
-	for i, line := range lines {
+	for i := 0; ; i++ {
+		line := text
+		rest := ""
+		if nl := strings.IndexByte(text, '\n'); nl >= 0 {
+			line, rest = text[:nl], text[nl+1:]
+		}
 		if i > 0 {
-			result.WriteString("\n")
+			result.WriteByte('\n')
 		}
-
-		if len(line) <= width {
-			result.WriteString(line)
-			continue
+		writeWrappedLine(&result, line, width)
+		if len(line) == len(text) {
+			break
 		}
+		text = rest
+	}
 
-		words := strings.Fields(line)
-		if len(words) == 0 {
-			result.WriteString(line)
-			continue
-		}
+	return result.String()
+}
 
-		currentLine := ""
-		for _, word := range words {
-			if len(word) > width {
-				if currentLine != "" {
-					result.WriteString(currentLine + "\n")
-					currentLine = ""
-				}
-				for len(word) > width {
-					result.WriteString(word[:width] + "\n")
-					word = word[width:]
-				}
-				if word != "" {
-					currentLine = word
-				}
-			} else if currentLine == "" {
-				currentLine = word
-			} else if len(currentLine)+1+len(word) <= width {
-				currentLine += " " + word
-			} else {
-				result.WriteString(currentLine + "\n")
-				currentLine = word
+// writeWrappedLine word-wraps a single line into b, tracking the current
+// line length instead of building each output line as its own string.
+func writeWrappedLine(b *strings.Builder, line string, width int) {
+	if len(line) <= width {
+		b.WriteString(line)
+		return
+	}
+
+	words := strings.Fields(line)
+	if len(words) == 0 {
+		b.WriteString(line)
+		return
+	}
+
+	lineLen := 0
+	for _, word := range words {
+		switch {
+		case len(word) > width:
+			if lineLen > 0 {
+				b.WriteByte('\n')
+				lineLen = 0
 			}
-		}
-		if currentLine != "" {
-			result.WriteString(currentLine)
+			for len(word) > width {
+				b.WriteString(word[:width])
+				b.WriteByte('\n')
+				word = word[width:]
+			}
+			if word != "" {
+				b.WriteString(word)
+				lineLen = len(word)
+			}
+		case lineLen == 0:
+			b.WriteString(word)
+			lineLen = len(word)
+		case lineLen+1+len(word) <= width:
+			b.WriteByte(' ')
+			b.WriteString(word)
+			lineLen += 1 + len(word)
+		default:
+			b.WriteByte('\n')
+			b.WriteString(word)
+			lineLen = len(word)
 		}
 	}
-
-	return result.String()
 }
 
 func max(a, b int) int {
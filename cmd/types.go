@@ -129,6 +129,7 @@ type GitHubMCPClient struct {
 	botName        string
 	clientName     string
 	userAgent      string
+	tokenMu        sync.Mutex
 	cachedToken    string
 	tokenExpiry    time.Time
 	requestTimeout time.Duration
@@ -144,6 +145,14 @@ type GitHubMCPClient struct {
 	pending        map[int]chan mcpEnvelope
 	requestCounter atomic.Int64
 	connectMu      sync.Mutex
+	sessionGen     atomic.Uint64
+
+	toolsMu     sync.Mutex
+	toolNames   map[string]struct{}
+	toolNamesAt time.Time
+
+	writeMu     sync.Mutex
+	nextWriteAt time.Time
 
 	endpointCh chan string
 }
@@ -156,6 +165,14 @@ type GitHubDeployHandler struct {
 	mcpClient *GitHubMCPClient
 	docker    *DockerOperations
 	yaml      *YAMLOperations
+
+	prCacheMu   sync.Mutex
+	prCache     map[prCacheKey]prCacheEntry
+	prCachePath string
+
+	updatesMu   sync.Mutex
+	updates     map[string]*updateCall
+	updatesDone map[string]updateEntry
 }
 
 type MCPRequest struct {
@@ -183,7 +200,7 @@ type mcpEnvelope struct {
 	ID      *int            `json:"id,omitempty"`
 	Method  string          `json:"method,omitempty"`
 	Params  json.RawMessage `json:"params,omitempty"`
-	Result  interface{}     `json:"result,omitempty"`
+	Result  json.RawMessage `json:"result,omitempty"`
 	Error   *MCPError       `json:"error,omitempty"`
 }
 
@@ -232,19 +249,21 @@ type DiagnosticsResponse struct {
 	Error   string            `json:"error,omitempty"`
 }
 
+// DiagnosticsResult mirrors agent-core's diagnostics payload. SlackResult is
+// never inspected here, so it is kept as raw JSON instead of a decoded map.
 type DiagnosticsResult struct {
-	Service             string                 `json:"service"`
-	Namespace           string                 `json:"namespace"`
-	ResourceType        string                 `json:"resource_type"`
-	Prompt              string                 `json:"prompt"`
-	IssueURL            string                 `json:"issue_url"`
-	SlackResult         map[string]interface{} `json:"slack_result"`
-	Channel             string                 `json:"slack_channel"`
-	IssueNumber         int                    `json:"issue_number"`
-	LogSnippet          string                 `json:"log_snippet"`
-	Summary             string                 `json:"summary"`
-	ResourceDescription string                 `json:"resource_description"`
-	EventsSummary       string                 `json:"events_summary"`
+	Service             string          `json:"service"`
+	Namespace           string          `json:"namespace"`
+	ResourceType        string          `json:"resource_type"`
+	Prompt              string          `json:"prompt"`
+	IssueURL            string          `json:"issue_url"`
+	SlackResult         json.RawMessage `json:"slack_result"`
+	Channel             string          `json:"slack_channel"`
+	IssueNumber         int             `json:"issue_number"`
+	LogSnippet          string          `json:"log_snippet"`
+	Summary             string          `json:"summary"`
+	ResourceDescription string          `json:"resource_description"`
+	EventsSummary       string          `json:"events_summary"`
 }
 
 type AuthenticatedTransport struct {
@@ -284,21 +284,21 @@ func replaceBinary(targetPath, newBinaryPath string) error {
 	tmpName := tmpFile.Name()
 	defer os.Remove(tmpName)
 
-	if _, err := tmpFile.Write([]byte{}); err != nil {
-		tmpFile.Close()
-		return fmt.Errorf("failed to initialize temp file: %w", err)
-	}
-	if err := tmpFile.Close(); err != nil {
-		return fmt.Errorf("failed to close temp file: %w", err)
-	}
-
-	data, err := os.ReadFile(newBinaryPath)
+	src, err := os.Open(newBinaryPath)
 	if err != nil {
+		tmpFile.Close()
 		return fmt.Errorf("failed to read new binary: %w", err)
 	}
-	if err := os.WriteFile(tmpName, data, 0o755); err != nil {
+	defer src.Close()
+
+	// Stream the binary into place instead of holding all of it in memory.
+	if _, err := io.Copy(tmpFile, src); err != nil {
+		tmpFile.Close()
 		return fmt.Errorf("failed to write temp binary: %w", err)
 	}
+	if err := tmpFile.Close(); err != nil {
+		return fmt.Errorf("failed to close temp file: %w", err)
+	}
 
 	if err := os.Rename(tmpName, targetPath); err != nil {
 		return err
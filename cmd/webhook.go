@@ -55,29 +55,34 @@ func (wh *WebhookHandler) handleReleasesWebhook(w http.ResponseWriter, r *http.R
 		"repositories", len(payload.Repositories),
 		"releases", len(payload.Releases))
 
-	summary, err := wh.bot.ProcessReleaseUpdate(r.Context(), payload)
+	// The agent analysis and PR creation take far longer than the server's
+	// write timeout, so the release is handled after the sender is answered.
+	go wh.processRelease(payload)
+
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusOK)
+	w.Write([]byte(`{"status": "received", "processed": false}`))
+}
+
+func (wh *WebhookHandler) processRelease(payload ReleasesWebhookPayload) {
+	ctx := context.Background()
+
+	summary, err := wh.bot.ProcessReleaseUpdate(ctx, payload)
 	if err != nil {
 		wh.bot.logger.Error("agent processing failed", "error", err)
-	} else {
-
-		go func() {
-			ctx := context.Background()
-			if len(wh.bot.config.Projects) == 0 {
-				wh.bot.logger.Error("no projects configured")
-				return
-			}
-			prURL, err := wh.bot.githubHandler.agentUpdatePR(ctx, payload, summary, &config.ProjectConfig{Projects: wh.bot.config.Projects})
-			if err != nil {
-				wh.bot.logger.Error("Agent failed to create PR", "error", err)
-				wh.bot.sendReleaseSummaryFromAgent(wh.AgentFeedbackChannel, payload, summary)
-			} else {
-				wh.bot.logger.Info("PR created", "url", prURL)
-				wh.bot.sendReleaseSummaryFromAgent(wh.AgentFeedbackChannel, payload, summary, prURL)
-			}
-		}()
+		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
-	w.Write([]byte(`{"status": "received", "processed": true}`))
+	if len(wh.bot.config.Projects) == 0 {
+		wh.bot.logger.Error("no projects configured")
+		return
+	}
+	prURL, err := wh.bot.githubHandler.agentUpdatePR(ctx, payload, summary, &config.ProjectConfig{Projects: wh.bot.config.Projects})
+	if err != nil {
+		wh.bot.logger.Error("Agent failed to create PR", "error", err)
+		wh.bot.sendReleaseSummaryFromAgent(wh.AgentFeedbackChannel, payload, summary)
+	} else {
+		wh.bot.logger.Info("PR created", "url", prURL)
+		wh.bot.sendReleaseSummaryFromAgent(wh.AgentFeedbackChannel, payload, summary, prURL)
+	}
 }
@@ -76,31 +76,34 @@ func (y *YAMLOperations) extractRepo(node *yaml.Node) string {
 	return ""
 }
 
+var knownMainRepos = map[string]bool{
+	"parity/polkadot":     true,
+	"paritytech/polkadot": true,
+	"ethereum/client-go":  true,
+	"hyperledger/fabric":  true,
+}
+
+var sidecarPatterns = []string{
+	"filebeat", "fluentd", "prometheus", "grafana", "nginx", "envoy",
+	"vault", "redis", "postgres", "mysql", "busybox", "alpine", "pause",
+}
+
+var mainPatterns = []string{"polkadot", "kusama", "node", "validator", "ethereum", "geth"}
+
 func (y *YAMLOperations) IsMainContainer(containerName, imageRepo string) bool {
 	containerName = strings.ToLower(containerName)
 	imageRepo = strings.ToLower(imageRepo)
 
-	knownMainRepos := map[string]bool{
-		"parity/polkadot":     true,
-		"paritytech/polkadot": true,
-		"ethereum/client-go":  true,
-		"hyperledger/fabric":  true,
-	}
 	if knownMainRepos[imageRepo] {
 		return true
 	}
 
-	sidecarPatterns := []string{
-		"filebeat", "fluentd", "prometheus", "grafana", "nginx", "envoy",
-		"vault", "redis", "postgres", "mysql", "busybox", "alpine", "pause",
-	}
 	for _, pattern := range sidecarPatterns {
 		if strings.Contains(imageRepo, pattern) || strings.Contains(containerName, pattern) {
 			return false
 		}
 	}
 
-	mainPatterns := []string{"polkadot", "kusama", "node", "validator", "ethereum", "geth"}
 	for _, pattern := range mainPatterns {
 		if strings.Contains(containerName, pattern) || strings.Contains(imageRepo, pattern) {
 			return true
@@ -109,13 +112,15 @@ func (y *YAMLOperations) IsMainContainer(containerName, imageRepo string) bool {
 	return false
 }
 
-func (y *YAMLOperations) UpdateAllImageTagsYAML(yamlContent string, repoToTag map[string]string) (string, bool, error) {
+// UpdateAllImageTagsYAML rewrites every image whose repo is in repoToTag and
+// returns the new YAML with the upgrades it made, recorded during the walk.
+func (y *YAMLOperations) UpdateAllImageTagsYAML(yamlContent string, repoToTag map[string]string) (string, []imageUpgrade, error) {
 	var root yaml.Node
 	if err := yaml.Unmarshal([]byte(yamlContent), &root); err != nil {
-		return "", false, err
+		return "", nil, err
 	}
 
-	var updated bool
+	var upgrades []imageUpgrade
 	var walk func(n *yaml.Node)
 	walk = func(n *yaml.Node) {
 		if n == nil {
@@ -125,8 +130,8 @@ func (y *YAMLOperations) UpdateAllImageTagsYAML(yamlContent string, repoToTag ma
 		case yaml.MappingNode:
 			for i := 0; i < len(n.Content)-1; i += 2 {
 				if n.Content[i].Value == "image" {
-					if y.updateImageNode(n.Content[i+1], repoToTag) {
-						updated = true
+					if oldImg, newImg, ok := y.updateImageNode(n.Content[i+1], repoToTag); ok {
+						upgrades = append(upgrades, imageUpgrade{oldImg: oldImg, newImg: newImg})
 					}
 				}
 				walk(n.Content[i+1])
@@ -144,8 +149,8 @@ func (y *YAMLOperations) UpdateAllImageTagsYAML(yamlContent string, repoToTag ma
 		walk(&root)
 	}
 
-	if !updated {
-		return yamlContent, false, nil
+	if len(upgrades) == 0 {
+		return yamlContent, nil, nil
 	}
 
 	var b strings.Builder
@@ -153,20 +158,23 @@ func (y *YAMLOperations) UpdateAllImageTagsYAML(yamlContent string, repoToTag ma
 	encoder.SetIndent(2)
 	defer encoder.Close()
 	if err := encoder.Encode(&root); err != nil {
-		return "", false, err
+		return "", nil, err
 	}
-	return strings.TrimRight(b.String(), "\n") + "\n", true, nil
+	return strings.TrimRight(b.String(), "\n") + "\n", upgrades, nil
 }
 
-func (y *YAMLOperations) updateImageNode(node *yaml.Node, repoToTag map[string]string) bool {
+// updateImageNode retags a single image node in place and reports the image
+// before and after the change.
+func (y *YAMLOperations) updateImageNode(node *yaml.Node, repoToTag map[string]string) (string, string, bool) {
 	if node.Kind == yaml.ScalarNode {
 		if idx := strings.Index(node.Value, ":"); idx > 0 {
 			repo := node.Value[:idx]
 			if tag, ok := repoToTag[repo]; ok {
 				newVal := repo + ":" + tag
 				if node.Value != newVal {
+					oldVal := node.Value
 					node.Value = newVal
-					return true
+					return oldVal, newVal, true
 				}
 			}
 		}
@@ -182,10 +190,11 @@ func (y *YAMLOperations) updateImageNode(node *yaml.Node, repoToTag map[string]s
 		}
 		if repo != "" && tagNode != nil {
 			if newTag, ok := repoToTag[repo]; ok && newTag != tagNode.Value {
+				oldImg := repo + ":" + tagNode.Value
 				tagNode.Value = newTag
-				return true
+				return oldImg, repo + ":" + newTag, true
 			}
 		}
 	}
-	return false
+	return "", "", false
 }
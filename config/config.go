@@ -77,9 +77,12 @@ type DiagnosticsKubernetesConfig struct {
 }
 
 type DiagnosticsMonitoringConfig struct {
-	Service      string `yaml:"service"`
-	LogTail      int    `yaml:"log_tail"`
-	EvalInterval int    `yaml:"eval_interval"`
+	Service         string `yaml:"service"`
+	LogTail         int    `yaml:"log_tail"`
+	LogSnippetLines int    `yaml:"log_snippet_lines"`
+	LogFilter       string `yaml:"log_filter"`
+	EvalInterval    int    `yaml:"eval_interval"`
+	DebounceSeconds *int   `yaml:"debounce_seconds"`
 }
 
 type ServerConfig struct {